@@ -3,16 +3,17 @@ This file implements Step7 Communication client.
 """
 
 
+import functools
 import logging
 import socket
 import struct
+import time
 
 from datetime import datetime
 from . import constants as const
 from . import utility as util
 from .exceptions import (
     CommTypeError,
-    DataTypeError,
     ErrorClass,
     ErrorCode,
     ReturnCode
@@ -29,14 +30,164 @@ from .tag import (
     Tag
 )
 
-logging.basicConfig(
-    level=logging.ERROR,
-    format='%(asctime)s %(message)s',
-    handlers=[
-        #logging.FileHandler("output.log"),
-        logging.StreamHandler()
-    ]
-)
+# applications configure handlers, the library stays quiet by default
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# precompiled formats (S7 is big endian on the wire)
+_U16                = struct.Struct('>H')
+_U16x2              = struct.Struct('>HH')
+_HEADER_ERROR       = struct.Struct('>BB')
+_PARAM_ERROR_RC     = struct.Struct('>HB')
+_SZL_HEADER         = struct.Struct('>BBHB')
+_CATALOG_ITEM       = struct.Struct('>H20sHHH')
+_CPUINFO_ITEM       = struct.Struct('>H32s')
+_PROTECTION_ITEM    = struct.Struct('>HHHHHH')
+_DIAG_ITEM          = struct.Struct('>HBB2s2s4s8s')
+_LED_ITEM           = struct.Struct('>HBB')
+_COMM_PROC_ITEM     = struct.Struct('>HHHII')
+_ISO_CR             = struct.Struct('>16sH2sH') # header, source TSAP, dst TSAP id/len, dst TSAP
+_ITEM_SPEC          = struct.Struct('>BBBBHHBBH')   # read/write item specification, address as hi byte + lo word
+_DATA_ITEM_HEADER   = struct.Struct('>BBH')         # return code, transport size, length
+_READ_REPLY         = struct.Struct('>H7xH4xBBBBBBH')  # TPKT length, PDU ref, error class/code, function, item count, first item header
+_WRITE_REPLY        = struct.Struct('>H7xH4xBB2xB') # TPKT length, PDU reference, error class/code, first item return code
+_BLOCKINFO          = struct.Struct('>1sBBHIIIHIHHHHH8s8s8sBB2s')
+_SETUP_COMM         = struct.Struct('>HHH')         # max AmQ calling, max AmQ called, PDU length
+_REQUEST_ITEM       = struct.Struct('>BHHBBH')      # transport size, elements, DB, area, address (hi byte, lo word)
+
+# fixed parts of the request templates, sliced once
+_READ_WRITE_HEAD    = const.S7_READ_WRITE[:19]      # up to item count
+_PN_HEAD            = const.S7_PN[:19]              # everything before the setup comm values
+_SET_CLOCK_HEAD     = const.S7_SET_CLOCK[:31]       # everything before the clock value
+_SZL_FIRST_HEAD     = const.S7_SZL_FIRST[:29]       # everything before SZL ID and index
+
+# response checks done on every telegram
+_NO_ERROR           = const.ParamErrorCode.NO_ERROR
+_RC_SUCCESS         = const.ReturnCode.SUCCESS
+_CLASS_NO_ERROR     = const.ErrorClass.NO_ERROR
+_LDU_YES            = const.LastDataUnit.YES
+_COTP_CC            = const.COTP.CONNECT_CONFIRM
+_AREA_DB            = const.Area.DB_DATABLOCKS
+_AREA_COUNTER       = const.Area.COUNTER_S7
+_AREA_TIMER         = const.Area.TIMER_S7
+_TYPE_BIT           = const.DataType.BIT
+_TYPE_BYTE          = const.DataType.BYTE
+_TYPE_COUNTER       = const.DataType.COUNTER
+_TYPE_TIMER         = const.DataType.TIMER
+_TYPE_STRING        = const.DataType.STRING
+_RC_RESERVED        = const.ReturnCode.RESERVED
+# item return code -> error text, so failed items don't build an exception just to format it
+_RETURN_CODE_TEXT   = tuple(str(ReturnCode(code)) for code in range(256))
+_ALL_SUCCESS        = bytes((_RC_SUCCESS,)) * 255   # return codes of a fully successful write, at most 255 items
+# read_area item types whose reply length is already a byte count (others report bits)
+_LENGTH_IN_BYTES    = frozenset((const.DataType.BIT, const.DataType.COUNTER, const.DataType.TIMER))
+# {read,write}_area_raw area -> (item transport size, word size, address shift, write data transport size)
+_RAW_TRANSFER = {
+    const.Area.COUNTER_S7: (
+        const.DataType.COUNTER, 
+        util.get_data_size_byte(const.DataType.COUNTER), 
+        0, 
+        const.TransportSize.OCTET_STRING
+    ),
+    const.Area.TIMER_S7: (
+        const.DataType.TIMER, 
+        util.get_data_size_byte(const.DataType.TIMER), 
+        0, 
+        const.TransportSize.OCTET_STRING
+    ),
+}
+# every other area is read and written as bytes, addressed in bits
+_RAW_BYTE_TRANSFER = (const.DataType.BYTE, 1, 3, const.TransportSize.BYTE_WORD_DWORD)
+# write_area item transport size -> (data transport size, data length shift, data length extra)
+_WRITE_DATA_TRANSPORT = {
+    const.DataType.BIT:     (const.TransportSize.BIT, 0, 0),
+    const.DataType.COUNTER: (const.TransportSize.OCTET_STRING, 0, 1),
+    const.DataType.TIMER:   (const.TransportSize.OCTET_STRING, 0, 1),
+    const.DataType.BYTE:    (const.TransportSize.BYTE_WORD_DWORD, 3, 0),   # length in bits
+}
+
+# SZL 0x0011 index -> CatalogCode (identifier, version) fields
+_CATALOG_FIELDS = {
+    0x0001: ('moduleOrderNumber', 'moduleVersion'),
+    0x0006: ('basicHardwareId', 'hardwareVersion'),
+    0x0007: ('basicFirmwareId', 'firmwareVersion'),
+    0x0081: ('firmwareExtensionId', 'firmwareExtVersion'),
+}
+
+# SZL 0x001C index -> CPUInfo field holding a plain text record
+_CPUINFO_NAMES = {
+    0x0001: 'systemName',
+    0x0002: 'moduleName',
+    0x0003: 'plantId',
+    0x0004: 'copyright',
+    0x0005: 'serialNumber',
+    0x0007: 'cpuType',
+    0x0008: 'memSerialNumber',
+    0x000b: 'locationId',
+}
+
+# SZL 0x001C index -> CPUInfo fields packed into one record
+_CPUINFO_RECORDS = {
+    0x0009: lambda name: {
+        'manufacturerId': '0x' + name[0:2].hex(),
+        'profileId': '0x' + name[2:4].hex(),
+        'profileSpec': '0x' + name[4:6].hex(),
+    },
+    0x000a: lambda name: {
+        'oemCopyright': name[0:26].strip(b'\x00 ').decode('latin-1'),
+        'oemId': '0x' + name[26:28].hex(),
+        'oemAddId': '0x' + name[28:32].hex(),
+    },
+}
+
+
+def _iter_szl_records(data:bytes, record:struct.Struct):
+    """
+    Iterate over the records of a SZL payload returned by read_szl
+
+    Args:
+        data(bytes):        SZL payload (header + records)
+        record(Struct):     layout of the leading fields of one record
+
+    Returns:
+        iterator of unpacked record tuples
+    """
+    if len(data) < 8:
+        return iter(())
+    section_length, szlCount = _U16x2.unpack_from(data, 4)
+    if section_length < record.size:
+        return iter(())
+    # don't trust the count beyond what was actually received
+    count = min(szlCount, (len(data) - 8) // section_length)
+    if section_length == record.size:
+        return record.iter_unpack(memoryview(data)[8:8 + count * section_length])
+    # padded records, only unpack the leading fields
+    return (record.unpack_from(data, 8 + item * section_length) for item in range(count))
+
+
+def _ttl_cache(method):
+    """
+    Cache the result of a Client method for cache_ttl_ms[method name] milliseconds.
+    A TTL of 0 disables caching and None keeps the result for the whole connection.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        ttl = self.cache_ttl_ms.get(name, 0)
+        if ttl == 0:
+            return method(self, *args, **kwargs)
+        key = (name, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic_ns()
+        entry = self._ttl_cache.get(key)
+        if entry is not None and (ttl is None or now - entry[0] < ttl * 1000000):
+            return entry[1]
+        value = method(self, *args, **kwargs)
+        # don't hold on to failed reads
+        if not getattr(value, 'error', ''):
+            self._ttl_cache[key] = (now, value)
+        return value
+    return wrapper
+
 
 class Client:
     """
@@ -65,26 +216,65 @@ class Client:
     RemoteTSAP_LO = 0
 
     _pdu_length = 0
+    _max_read_bytes = 0     # raw read payload per PDU, set once the PDU length is negotiated
+    _max_write_bytes = 0    # raw write payload per PDU, set once the PDU length is negotiated
     _PduSizeRequested = 480
+    _max_amq_called = 1     # requests the PLC accepts in parallel
+    _MaxAmQRequested = 8
+    _pdu_ref = 0
 
     ConnType        = const.ClientConnectionType.PG
     sock_timeout    = 2 # in seconds
-    _tcp_connected  = False
-    _iso_connected  = False
-    _pdu_negotiated = False
+    keepalive       = (60, 10, 3) # idle s, interval s, probes before a silent link is dropped (None: off)
+    # connection state bits
+    _TCP_CONNECTED  = 0x01
+    _ISO_CONNECTED  = 0x02
+    _PDU_NEGOTIATED = 0x04
+    _state          = 0x00
     _SOCKBUFSIZE    = 4096
-    cpu_info        = CPUInfo()
-    controller      = 1500 # S7-300, S7-400, S7-1500, etc
-
-    endian          = const.Endian.big
-    cache_data      = {}
+    _sock_send      = None
+    _sock_sendmsg   = None  # scatter-gather send, None where the platform lacks sendmsg
+    _sock_recv_into = None
+    _rx_buf         = None
+    _rx_view        = None
+    _rx_start       = 0     # first unparsed byte in the receive buffer
+    _rx_end         = 0     # end of the received bytes
+    _iso_cr         = None  # connection request for the current TSAPs
+    _read_req_buf   = None  # back to back 31 byte read requests, reused per connection
+    _write_req_buf  = None  # 35 byte write header, payload is sent straight from the caller's buffer
+    _cpu_info       = None # read on first use of cpu_info
+    _controller     = None # S7-300, S7-400, S7-1500, etc, derived from cpu_info on first use
+
+    endian          = const.Endian.big # byte order of PLC values, telegram headers are always big endian
+    coalesce_gap    = 16 # unused bytes read_multi may read through to merge items
+    small_string_threshold = 16 # STRING characters read along with the header, longer strings take a second read
+    trust_address_range = False # S7-300/400: don't read block info just to clamp raw reads/writes
+    _MULTI_PLAN_CACHE_SIZE = 64
+    # result cache lifetime per method in ms (0: disabled, None: until close)
+    cache_ttl_ms    = {
+        'read_cpu_info': None,
+        'read_catalog_code': 0,
+        'read_comm_proc': 0,
+        'read_protection': 0,
+        'read_cpu_leds': 500,
+        'read_cpu_status': 0,    # stop/start always check a fresh status
+    }
 
     __log = logging.getLogger(f"{__module__}.{__qualname__}")
 
 
-    def __init__(self, host:str, port:int=102, rack:int=0, slot:int=0):
+    def __init__(self, host:str, port:int=102, rack:int=0, slot:int=0, socket_options:list=None, sock_timeout:float=None):
         """
         Constructor
+
+        Args:
+            host (str):             ip address(IPV4) of PLC
+            port (int):             port number of PLC
+            rack (int):             rack number of CPU
+            slot (int):             slot number of CPU
+            socket_options (list):  extra (level, optname, value) tuples passed to setsockopt
+            sock_timeout (float):   seconds to wait on a send or receive, default 2.
+                                    Lower it to notice a dead PLC sooner on fast polling loops
         """
 
         # specify host and port
@@ -92,9 +282,61 @@ class Client:
         self.port = port
         self.rack = rack
         self.slot = slot
+        self.socket_options = socket_options or []
+        if sock_timeout is not None:
+            self.sock_timeout = sock_timeout
+        self.cache_ttl_ms = dict(self.cache_ttl_ms)
+        self._ttl_cache = {}
+        self.cache_data = {}    # (block type, block number) -> BlockInfo
+        self._multi_plans = {}  # read_multi item list shape -> plan
         self.RemoteTSAP = (self.ConnType << 8) + (self.rack * 0x20) + self.slot
 
 
+    @property
+    def cpu_info(self) -> CPUInfo:
+        """
+        CPU identification, read from the PLC the first time it is needed.
+        A failed read is returned but not kept, the next access reads again.
+        """
+        if self._cpu_info is None:
+            info = self.read_cpu_info()
+            if info.error:
+                return info
+            self._cpu_info = info
+        return self._cpu_info
+
+
+    @cpu_info.setter
+    def cpu_info(self, value:CPUInfo):
+        self._cpu_info = value
+
+
+    @property
+    def controller(self) -> int:
+        """
+        Controller family (300, 400, 1200, 1500) taken from the CPU system name.
+        Can be set before the first raw access to skip reading cpu_info.
+        Raises CommTypeError while cpu_info cannot be read, the next access retries.
+        """
+        if self._controller is None:
+            cpu_info = self.cpu_info
+            if cpu_info.error:
+                self.__log.error(f"self.controller(): Failed to read cpu_info: {cpu_info.error}")
+                raise CommTypeError(f"Failed to read cpu_info: {cpu_info.error}")
+            try:
+                self._controller = int(cpu_info.systemName.split("/")[0][2:])
+            except ValueError:
+                # system name read fine but is not in the known format
+                self.__log.error(f"self.controller(): Unknown system name {cpu_info.systemName!r}")
+                self._controller = 1500
+        return self._controller
+
+
+    @controller.setter
+    def controller(self, value:int):
+        self._controller = value
+
+
     def __enter__(self):
         """
         Used by with statement: https://peps.python.org/pep-0343/
@@ -104,8 +346,6 @@ class Client:
         self.set_connection_parameters(LocalTSAP=self.LocalTSAP, RemoteTSAP=self.RemoteTSAP)
         self.iso_connect()
         self.negotiate_pdu_length()
-        self.cpu_info = self.read_cpu_info()
-        self.controller = int(self.cpu_info.systemName.split("/")[0][2:])
         return self
 
 
@@ -149,43 +389,151 @@ class Client:
 
         self._ip = ip
         self._port = port
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        # every exchange is a small request/response; don't let Nagle delay it
+        if hasattr(socket, "TCP_NODELAY"):
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # reconnecting right after a crash shouldn't trip over TIME_WAIT
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.keepalive:
+            self._set_keepalive(*self.keepalive)
+        for level, optname, value in self.socket_options:
+            self._sock.setsockopt(level, optname, value)
         self._sock.settimeout(self.sock_timeout)
+        # bound socket methods used on every exchange
+        self._sock_send = self._sock.sendall
+        self._sock_sendmsg = getattr(self._sock, "sendmsg", None)
+        self._sock_recv_into = self._sock.recv_into
+        self._alloc_rx_buffer(size=self._SOCKBUFSIZE)
         try:
             self._sock.connect((ip, port))
-            self._tcp_connected = True
+            self._state = self._TCP_CONNECTED
         except socket.timeout:
             self.__log.error(f"self.tcp_connect(): {str(socket.timeout)}")
         
 
+    def _set_keepalive(self, idle:int, interval:int, count:int):
+        """
+        Enable TCP keepalive so a dropped PLC link is noticed on a long lived connection.
+        Timer options the platform does not offer are skipped.
+
+        Args:
+            idle(int): seconds without traffic before the first probe
+            interval(int): seconds between probes
+            count(int): unanswered probes before the connection is dropped
+        """
+
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            # Linux and newer BSDs
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle)
+        elif hasattr(socket, "TCP_KEEPALIVE"):
+            # macOS
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count)
+        if hasattr(socket, "SIO_KEEPALIVE_VALS"):
+            # Windows takes idle and interval in ms, the probe count is fixed
+            self._sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, idle * 1000, interval * 1000))
+
+
     def close(self):
         """
         Close connection.
         """
 
         self._sock.close()
-        self._tcp_connected = self._iso_connected = self._pdu_negotiated = False
-
+        self._ttl_cache.clear()
+        self.cache_data.clear()
+        self._cpu_info = self._controller = None
+        self._sock_send = self._sock_sendmsg = self._sock_recv_into = None
+        # a new connection negotiates its own PDU size
+        self._rx_buf = self._rx_view = None
+        self._rx_start = self._rx_end = 0
+        self._read_req_buf = self._write_req_buf = None
+        self._max_read_bytes = self._max_write_bytes = 0
+        self._state = 0x00
+
+
+    def invalidate_cache(self, name:str=None):
+        """
+        Drop cached results, e.g. after downloading a new program to the PLC
 
-    def _tcp_send(self, send_data:bytes):
+        Args:
+            name(str): method name, None drops every cached result
+                        including block lengths and read_multi plans
         """
-        Send data 
+        if name is None or name == 'read_cpu_info':
+            self._cpu_info = None
+        if name is None:
+            self._ttl_cache.clear()
+            self.cache_data.clear()
+            self._multi_plans.clear()
+            return
+        for key in [key for key in self._ttl_cache if key[0] == name]:
+            del self._ttl_cache[key]
+
+
+    def _send_impl(self, send_data:bytes, required_state:int, tail:tuple=None):
+        """
+        Send data once the connection reached the required state
 
         Args:
             send_data(bytes): Step7 Communication data
+            required_state(int): bitmask of _TCP_CONNECTED, _ISO_CONNECTED, _PDU_NEGOTIATED
+            tail(tuple): optional payload buffers sent right after send_data in the same telegram
         """
 
-        if self._tcp_connected:
-            self.__log.debug(f'self._tcp_send(): \n{send_data.hex()}')
+        if self._state & required_state == required_state:
+            if self.__log.isEnabledFor(logging.DEBUG):
+                self.__log.debug('self._send_impl(): \n%s', send_data.hex() + b''.join(tail or ()).hex())
             try:
-                self._sock.send(send_data)
+                if tail is None:
+                    self._sock_send(send_data)
+                else:
+                    self._send_buffers(buffers=(send_data, *tail))
             except socket.timeout:
-                self.__log.error(f"self._tcp_send(): {str(socket.timeout)}")
+                # sendall can't tell how much went out, the PLC may hold half a telegram
+                self._state = 0x00
+                self.__log.error(f"self._send_impl(): {str(socket.timeout)}")
+        elif self._state & self._ISO_CONNECTED:
+            self.__log.error(f"self._send_impl(): ISO COTP is not set up.")
+            raise CommTypeError("ISO COTP is not set up.")
         else:
-            self.__log.error(f"self._tcp_send(): Socket is not connected. Please use connect method")
+            self.__log.error(f"self._send_impl(): Socket is not connected. Please use connect method")
             raise CommTypeError("Socket is not connected. Please use connect method")
 
 
+    def _send_buffers(self, buffers:tuple):
+        """
+        Send several buffers back to back without joining them first
+
+        Args:
+            buffers(tuple): bytes-like objects making up one telegram
+        """
+
+        if self._sock_sendmsg is None:
+            self._sock_send(b''.join(buffers))
+            return
+        sent = self._sock_sendmsg(buffers)
+        if sent < sum(len(buffer) for buffer in buffers):
+            # partial send, only the rare slow path pays for the join
+            self._sock_send(b''.join(buffers)[sent:])
+
+
+    def _tcp_send(self, send_data:bytes):
+        """
+        Send data 
+
+        Args:
+            send_data(bytes): Step7 Communication data
+        """
+
+        self._send_impl(send_data, self._TCP_CONNECTED)
+
+
     def _iso_send(self, send_data:bytes):
         """
         Send data 
@@ -194,51 +542,103 @@ class Client:
             send_data(bytes): Step7 Communication data
         """
 
-        if self._tcp_connected and self._iso_connected:
-            self.__log.debug(f'self._iso_send(): \n{send_data.hex()}')
-            try:
-                self._sock.send(send_data)
-            except socket.timeout:
-                self.__log.error(f"self._iso_send(): {str(socket.timeout)}")
-        else:
-            self.__log.error(f"self._iso_send(): Socket is not connected. Please use connect method")
-            raise CommTypeError("Socket is not connected. Please use connect method")
+        self._send_impl(send_data, self._TCP_CONNECTED | self._ISO_CONNECTED)
 
 
-    def _send(self, send_data:bytes):
+    def _send(self, send_data:bytes, tail:tuple=None):
         """
         Send data 
 
         Args:
             send_data(bytes): Step7 Communication data
+            tail(tuple): optional payload buffers sent right after send_data in the same telegram
         """
 
-        if self._tcp_connected and self._iso_connected and self._pdu_negotiated:
-            self.__log.debug(f'self._send(): \n{send_data.hex()}')
-            try:
-                self._sock.send(send_data)
-            except socket.timeout:
-                self.__log.error(f"self._send(): {str(socket.timeout)}")
-        else:
-            self.__log.error(f"self._send(): ISO COTP is not set up.")
-            raise CommTypeError("ISO COTP is not set up.")
+        self._send_impl(send_data, self._TCP_CONNECTED | self._ISO_CONNECTED | self._PDU_NEGOTIATED, tail)
 
 
     def _recv(self):
         """
-        Receive data
+        Receive one telegram, reading as much as the socket has into the
+        connection receive buffer so back to back replies cost one recv
 
         Returns:
-            data(bytes)
+            data(memoryview): view of the telegram, valid until the next receive.
+                                Its length is the TPKT length, empty on timeout
         """
         data = bytes()
         try:
-            data = self._sock.recv(self._SOCKBUFSIZE)
+            # TPKT header carries the length of the whole telegram
+            self._fill_rx_buffer(count=4)
+            start = self._rx_start
+            length = _U16.unpack_from(self._rx_buf, start + 2)[0]
+            # TPKT version 3 and at least the COTP header, anything else means the stream is out of sync
+            if self._rx_buf[start] != 0x03 or length < 7:
+                self._state = 0x00
+                self.__log.error(f"self._recv(): Invalid TPKT header")
+                raise CommTypeError("Invalid TPKT header")
+            self._fill_rx_buffer(count=length)
+            start = self._rx_start
+            data = self._rx_view[start:start + length]
+            self._rx_start = start + length
         except socket.timeout:
             self.__log.error(f"self._recv(): {str(socket.timeout)}")
         return data
 
 
+    def _fill_rx_buffer(self, count:int):
+        """
+        Make sure the receive buffer holds at least count unparsed bytes
+
+        Args:
+            count(int): number of bytes needed from the current telegram start
+        """
+        start = self._rx_start
+        end = self._rx_end
+        if end - start >= count:
+            return
+        if start == end:
+            start = end = 0
+        elif start + count > len(self._rx_buf):
+            # move the partial telegram to the front, the previous telegram is no longer in use
+            self._rx_buf[:end - start] = self._rx_view[start:end]
+            end -= start
+            start = 0
+        self._rx_start = start
+        self._rx_end = end
+        if count > len(self._rx_buf):
+            self._alloc_rx_buffer(size=count)
+        view = self._rx_view
+        size = len(view)
+        while end - start < count:
+            received = self._sock_recv_into(view[end:], size - end)
+            if not received:
+                self.__log.error(f"self._fill_rx_buffer(): Connection closed by PLC")
+                raise CommTypeError("Connection closed by PLC")
+            end += received
+            self._rx_end = end
+
+
+    def _alloc_rx_buffer(self, size:int):
+        """
+        Make sure the receive buffer holds at least size bytes.
+        A new buffer is allocated since views of the old one may still be alive,
+        unparsed bytes are carried over to its start.
+
+        Args:
+            size(int): minimum buffer size in bytes
+        """
+        if self._rx_buf is None or len(self._rx_buf) < size:
+            rx_buf = bytearray(max(size, self._SOCKBUFSIZE))
+            pending = self._rx_end - self._rx_start
+            if pending:
+                rx_buf[:pending] = self._rx_view[self._rx_start:self._rx_end]
+            self._rx_buf = rx_buf
+            self._rx_view = memoryview(rx_buf)
+            self._rx_start = 0
+            self._rx_end = pending
+
+
     def set_connection_parameters(self, LocalTSAP:int, RemoteTSAP:int):
         LocTSAP = LocalTSAP & 0x0000FFFF
         RemTSAP = RemoteTSAP & 0x0000FFFF
@@ -246,26 +646,30 @@ class Client:
         self.LocalTSAP_LO = (LocTSAP & 0x00FF)
         self.RemoteTSAP_HI = (RemTSAP >> 8)
         self.RemoteTSAP_LO = (RemTSAP & 0x00FF)
+        # rebuilt on the next iso_connect
+        self._iso_cr = None
 
 
     def iso_connect(self):
-        # connection request
-        request = const.ISO_CR
-        request[16] = self.LocalTSAP_HI
-        request[17] = self.LocalTSAP_LO
-        request[20] = self.RemoteTSAP_HI
-        request[21] = self.RemoteTSAP_LO
-        self._tcp_send(send_data=bytes(request))
+        # connection request, only the TSAPs differ from the template
+        if self._iso_cr is None:
+            self._iso_cr = _ISO_CR.pack(
+                const.ISO_CR[:16],
+                (self.LocalTSAP_HI << 8) | self.LocalTSAP_LO,
+                const.ISO_CR[18:20],
+                (self.RemoteTSAP_HI << 8) | self.RemoteTSAP_LO
+            )
+        self._tcp_send(send_data=self._iso_cr)
         data = self._recv()
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-        self._iso_connected = False
+        length = len(data)
+        self._state &= ~(self._ISO_CONNECTED | self._PDU_NEGOTIATED)
         if (length == 22):
-            PDUType = struct.unpack_from('B', data, 5)[0]
-            if (PDUType != const.COTP.CONNECT_CONFIRM):
+            PDUType = data[5]
+            if (PDUType != _COTP_CC):
                 self.__log.error(f"self.iso_connect(): Failed to perform ISO connect")
                 raise CommTypeError("Failed to perform ISO connect")
             else:
-                self._iso_connected = True
+                self._state |= self._ISO_CONNECTED
         else:
             self.__log.error(f"self.iso_connect(): Invalid PDU")
             raise CommTypeError("Invalid PDU")
@@ -277,24 +681,33 @@ class Client:
         ROSCTR:Ack_Data:Function:Setup Communication
         """
 
-        # Set PDU Size Requested
-        request = bytearray(const.S7_PN)
-        struct.pack_into(f'{self.endian}H', request, 23, self._PduSizeRequested)
+        # Set parallel jobs and PDU Size Requested
+        request = _PN_HEAD + _SETUP_COMM.pack(
+            self._MaxAmQRequested,
+            self._MaxAmQRequested,
+            self._PduSizeRequested
+        )
         # Sends the connection request telegram
         self._iso_send(send_data=request)
         data = self._recv()
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-        header_error_class, header_error_code = struct.unpack_from('BB', data, 17)
-        self._pdu_negotiated = False
+        length = len(data)
+        header_error_class, header_error_code = _HEADER_ERROR.unpack_from(data, 17)
+        self._state &= ~self._PDU_NEGOTIATED
         # check S7 Error
         if (length == 27 
-            and header_error_class == const.ErrorClass.NO_ERROR
+            and header_error_class == _CLASS_NO_ERROR
             and header_error_code == 0x00
         ):
-            # Get PDU Size Negotiated
-            self._pdu_length = struct.unpack_from(f'{self.endian}H', data, 25)[0]
+            # Get parallel jobs and PDU Size Negotiated
+            _, max_amq_called, self._pdu_length = _SETUP_COMM.unpack_from(data, 21)
+            self._max_amq_called = max(1, max_amq_called)
             if (self._pdu_length > 0):
-                self._pdu_negotiated = True
+                # room for a full PDU plus TPKT/COTP/S7 headers per parallel job
+                self._alloc_rx_buffer(size=(self._pdu_length + 32) * self._max_amq_called)
+                # fixed for the connection, raw transfers split on these
+                self._max_read_bytes = self._pdu_length - 18   # 18 = Reply telegram header
+                self._max_write_bytes = self._pdu_length - 35  # 35 = Request telegram header
+                self._state |= self._PDU_NEGOTIATED
             else:
                 self.__log.error(f"self.negotiate_pdu_length(): Unable to negotiate PDU")
                 raise CommTypeError("Unable to negotiate PDU")
@@ -315,15 +728,14 @@ class Client:
             datetime:   datetime object of PLC
         """
 
-        request = bytes(const.S7_GET_CLOCK)
-        self._send(send_data=request)
+        self._send(send_data=const.S7_GET_CLOCK)
         data = self._recv()
 
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
+        length = len(data)
         if (length > 30):  # the minimum expected
-            param_error_code, data_return_code = struct.unpack_from(f'{self.endian}HB', data, 27)
-            if (param_error_code == const.ParamErrorCode.NO_ERROR 
-                and data_return_code == const.ReturnCode.SUCCESS
+            param_error_code, data_return_code = _PARAM_ERROR_RC.unpack_from(data, 27)
+            if (param_error_code == _NO_ERROR 
+                and data_return_code == _RC_SUCCESS
             ):
                 # year1 = util.bcd_to_byte(data[34])
                 return util.get_datetime(buffer=data, offset=35)
@@ -335,7 +747,7 @@ class Client:
             raise CommTypeError("Invalid PDU size")
 
 
-    def sync_plc_time(self, utc:bool=False) -> datetime:
+    def sync_plc_time(self, utc:bool=False) -> str:
         """
         Sync PLC time to host time.
 
@@ -343,9 +755,39 @@ class Client:
             utc(bool):   use UTC time (True) or local time (False)
         """
 
-        now = datetime.utcnow() if utc else datetime.now()
+        return self._set_plc_time_from_epoch(epoch_ns=time.time_ns(), utc=utc)
+
+
+    def _set_plc_time_from_epoch(self, epoch_ns:int, utc:bool=False) -> str:
+        """
+        Set PLC time from a unix timestamp without going through datetime.
+
+        Args:
+            epoch_ns(int):  nanoseconds since the unix epoch (e.g. time.time_ns())
+            utc(bool):      use UTC time (True) or local time (False)
+        """
 
-        return self.set_plc_time(dt=now)
+        seconds, nanoseconds = divmod(epoch_ns, 1000000000)
+        tm = time.gmtime(seconds) if utc else time.localtime(seconds)
+        millisecond = nanoseconds // 1000000
+        # shift python (monday=0) to s7 (sunday=1)
+        dow = (tm.tm_wday + 1) % 7 + 1
+        bcd = util.byte_to_bcd
+        self._set_plc_clock(clock=bytes((
+            bcd(tm.tm_year % 100),
+            bcd(tm.tm_mon),
+            bcd(tm.tm_mday),
+            bcd(tm.tm_hour),
+            bcd(tm.tm_min),
+            bcd(tm.tm_sec),
+            bcd(millisecond // 10),
+            bcd((millisecond % 10) * 10 + dow)
+        )))
+        return '%04d-%02d-%02d %02d:%02d:%02d.%06d' % (
+            tm.tm_year, tm.tm_mon, tm.tm_mday,
+            tm.tm_hour, tm.tm_min, tm.tm_sec,
+            nanoseconds // 1000
+        )
 
 
     def set_plc_time(self, dt:datetime) -> str:
@@ -356,24 +798,35 @@ class Client:
             dt(datetime):   datetime object (e.g. datetime.now())
         """
 
-        request = bytearray(const.S7_SET_CLOCK)
-        struct.pack_into('8s', request, 31, util.set_datetime(DT=dt))
+        self._set_plc_clock(clock=util.set_datetime(DT=dt))
+        return f"{dt}"
+
+
+    def _set_plc_clock(self, clock:bytes):
+        """
+        Send the set clock request.
+
+        Args:
+            clock(bytes):   8 bytes S7 DATE_AND_TIME (BCD)
+        """
+
+        request = _SET_CLOCK_HEAD + clock
 
         self._send(send_data=request)
         data = self._recv()
 
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
+        length = len(data)
         if (length > 30): # the minimum expected
-            param_error_code = struct.unpack_from(f'{self.endian}H', data, 27)[0]
-            if (param_error_code != const.ParamErrorCode.NO_ERROR):
+            param_error_code = _U16.unpack_from(data, 27)[0]
+            if (param_error_code != _NO_ERROR):
                 self.__log.error(f"self.set_plc_time(): Invalid Response")
                 raise CommTypeError("Invalid Response")
         else:
             self.__log.error(f"self.set_plc_time(): Invalid PDU size")
             raise CommTypeError("Invalid PDU size")
-        return f"{dt}"
 
 
+    @_ttl_cache
     def read_cpu_status(self) -> CPUStatus:
         """
         Read CPU model.
@@ -382,20 +835,20 @@ class Client:
             CPUStatus(NamedTuple): (requestedMode(str), previousMode(str), error(str))
         """
 
-        request = bytearray(const.S7_SZL_FIRST)
-        struct.pack_into(f'{self.endian}H', request, 29, const.SystemStateList.CPU_STATUS)
+        request = _SZL_FIRST_HEAD + _U16x2.pack(const.SystemStateList.CPU_STATUS, 0x0000)
 
         self._send(send_data=request)
         data = self._recv()
 
         cpuStatus = CPUStatus()
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
+        length = len(data)
         if (length > 30): # the minimum expected
-            param_error_code = struct.unpack_from(f'{self.endian}H', data, 27)[0]
-            if (param_error_code == const.ParamErrorCode.NO_ERROR):
-                status = struct.unpack_from('B', data, 44)[0]
-                hiNib, loNib = util.byte_to_nibbles(status)
-                cpuStatus = cpuStatus._replace(
+            param_error_code = _U16.unpack_from(data, 27)[0]
+            if (param_error_code == _NO_ERROR):
+                status = data[44]
+                hiNib = status >> 4
+                loNib = status & 0x0F
+                cpuStatus = CPUStatus(
                     requestedMode=util.get_cpu_status(Status=loNib),
                     previousMode=util.get_cpu_status(Status=hiNib)
                 )
@@ -408,6 +861,7 @@ class Client:
         return cpuStatus
 
 
+    @_ttl_cache
     def read_catalog_code(self) -> CatalogCode:
         """
         Read Catalog Code.
@@ -416,54 +870,40 @@ class Client:
             CatalogCode(NamedTuple)
         """
 
-        catalogCode = CatalogCode()
+        fields = {}
 
-        request = bytearray(const.S7_SZL_FIRST)
-        struct.pack_into(f'{self.endian}H', request, 29, const.SystemStateList.CATALOG_CODE)
+        request = _SZL_FIRST_HEAD + _U16x2.pack(const.SystemStateList.CATALOG_CODE, 0x0000)
 
         self._send(send_data=request)
         data = self._recv()
 
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
+        length = len(data)
         if (length > 30): # the minimum expected
-            param_error_code, data_return_code = struct.unpack_from(f'{self.endian}HB', data, 27)
-            if (param_error_code == const.ParamErrorCode.NO_ERROR 
-                and data_return_code == const.ReturnCode.SUCCESS
+            param_error_code, data_return_code = _PARAM_ERROR_RC.unpack_from(data, 27)
+            if (param_error_code == _NO_ERROR 
+                and data_return_code == _RC_SUCCESS
             ):
-                offset = 37
-                section_length, szlCount = struct.unpack_from(f'{self.endian}HH', data, offset)
-                offset += 4
-                for item in range(szlCount):
-                    (
-                        index, 
-                        mlfb, 
-                        bgtype, 
-                        ausbg, 
-                        ausbe
-                    ) = struct.unpack_from(f'{self.endian}H20sHHH', data, offset)
-                    offset += section_length
-                    mlfb = mlfb.decode().strip()
-                    if index == 0x0001:
-                        catalogCode = catalogCode._replace(moduleOrderNumber=mlfb)
-                        catalogCode = catalogCode._replace(moduleVersion=f"{ausbg}.{ausbe}")
-                    elif index == 0x0006:
-                        catalogCode = catalogCode._replace(basicHardwareId=mlfb)
-                        catalogCode = catalogCode._replace(hardwareVersion=f"{ausbg}.{ausbe}")
-                    elif index == 0x0007:
-                        catalogCode = catalogCode._replace(basicFirmwareId=mlfb)
-                        catalogCode = catalogCode._replace(firmwareVersion=f"{ausbg}.{ausbe}")
-                    elif index == 0x0081:
-                        catalogCode = catalogCode._replace(firmwareExtensionId=mlfb)
-                        catalogCode = catalogCode._replace(firmwareExtVersion=f"{ausbg}.{ausbe}")
+                for (
+                    index, 
+                    mlfb, 
+                    bgtype, 
+                    ausbg, 
+                    ausbe
+                ) in _iter_szl_records(data[33:], _CATALOG_ITEM):
+                    names = _CATALOG_FIELDS.get(index)
+                    if names is not None:
+                        fields[names[0]] = mlfb.strip(b'\x00 ').decode('latin-1')
+                        fields[names[1]] = f"{ausbg}.{ausbe}"
             else:
                 self.__log.error(f"self.read_catalog_code(): {ErrorCode(param_error_code)}")
                 raise ErrorCode(param_error_code)
         else:
             self.__log.error(f"self.read_catalog_code(): Invalid PDU size")
             raise CommTypeError("Invalid PDU size")
-        return catalogCode
+        return CatalogCode(**fields)
 
 
+    @_ttl_cache
     def read_cpu_info(self) -> CPUInfo:
         """
         Read CPU model.
@@ -472,67 +912,25 @@ class Client:
             CPUInfo(NamedTuple)
         """
 
-        cpuInfo = CPUInfo()
-        
         data = self.read_szl(id=const.SystemStateList.CPU_ID)
 
         totalLength = len(data)
         if totalLength < 34:
-            return cpuInfo(error="Invalid PDU Length")
-
-        offset = 4
-        section_length, szlCount = struct.unpack_from(f'{self.endian}HH', data, offset)
-        offset += 4
-        for item in range(szlCount):
-            if offset + 34 >= totalLength:
-                break
-            index, name = struct.unpack_from(
-                f'{self.endian}H32s', 
-                data, 
-                offset
-            )
-            offset += section_length
-            if index == 0x0001:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(systemName=name)
-            elif index == 0x0002:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(moduleName=name)
-            elif index == 0x0003:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(plantId=name)
-            elif index == 0x0004:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(copyright=name)
-            elif index == 0x0005:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(serialNumber=name)
-            elif index == 0x0007:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(cpuType=name)
-            elif index == 0x0008:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(memSerialNumber=name)
-            elif index == 0x0009:
-                manufacturerId = f"0x{name[0:2].hex()}"
-                cpuInfo = cpuInfo._replace(manufacturerId=manufacturerId)
-                profileId = f"0x{name[2:4].hex()}"
-                cpuInfo = cpuInfo._replace(profileId=profileId)
-                profileSpec = f"0x{name[4:6].hex()}"
-                cpuInfo = cpuInfo._replace(profileSpec=profileSpec)
-            elif index == 0x000a:
-                oemCopyright = name[0:26].decode().strip()
-                cpuInfo = cpuInfo._replace(oemCopyright=oemCopyright)
-                oemId = f"0x{name[26:28].hex()}"
-                cpuInfo = cpuInfo._replace(oemId=oemId)
-                oemAddId = f"0x{name[28:32].hex()}"
-                cpuInfo = cpuInfo._replace(oemAddId=oemAddId)
-            elif index == 0x000b:
-                name = name.decode().strip()
-                cpuInfo = cpuInfo._replace(locationId=name)
-        return cpuInfo
+            return CPUInfo(error="Invalid PDU Length")
+
+        fields = {}
+        for index, name in _iter_szl_records(data, _CPUINFO_ITEM):
+            field = _CPUINFO_NAMES.get(index)
+            if field is not None:
+                fields[field] = name.strip(b'\x00 ').decode('latin-1')
+            else:
+                record = _CPUINFO_RECORDS.get(index)
+                if record is not None:
+                    fields.update(record(name))
+        return CPUInfo(**fields)
 
 
+    @_ttl_cache
     def read_comm_proc(self) -> list:
         """
         Read communication processor
@@ -548,18 +946,7 @@ class Client:
         if totalLength < 34:
             return CommProc(error="Invalid PDU Length")
 
-        offset = 4
-        section_length, szlCount = struct.unpack_from(f'{self.endian}HH', data, offset)
-        offset += 4
-        reservedLength = section_length - 14
-        for item in range(szlCount):
-            if offset + 14 + reservedLength -1 >= totalLength:
-                break
-            index, pdu, anz, mpiBPS, mkbusBPS, res = struct.unpack_from(
-                f'{self.endian}HHHII{reservedLength}s', 
-                data, 
-                offset
-            )
+        for index, pdu, anz, mpiBPS, mkbusBPS in _iter_szl_records(data, _COMM_PROC_ITEM):
             result.append(
                 CommProc(
                     maxPDU=pdu, 
@@ -568,82 +955,82 @@ class Client:
                     mkbusRate=mkbusBPS
                 )
             )
-            offset += section_length
         return result
 
 
-    def stop_plc(self) -> bool:
+    def stop_plc(self, force:bool=False) -> bool:
         """
         Stop PLC
 
+        Args:
+            force(bool): send the command without checking the CPU status first
+
         Returns:
             status(bool): command result
                             True (success)
                             False (not executed)
         """
-        cpuStatus = self.read_cpu_status()
+        return self._control(template=const.S7_STOP, skip_mode="Stop", min_length=19, force=force)
 
-        if cpuStatus.requestedMode != "Stop":
-            request = bytearray(const.S7_STOP)
-            self._send(send_data=request)
-            data = self._recv()
 
-            length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-            if (length > 19): # the minimum expected
-                header_error_class, header_error_code, function = struct.unpack_from('BBB', data, 17)
-                if header_error_class != const.ErrorClass.NO_ERROR or header_error_code != 0:
-                    return False
-        return True
-
-
-    def start_plc_cold(self) -> bool:
+    def start_plc_cold(self, force:bool=False) -> bool:
         """
         Start PLC cold (reset memory)
 
+        Args:
+            force(bool): send the command without checking the CPU status first
+
         Returns:
             status(bool): command result
                             True (success)
                             False (not executed)
         """
-        cpuStatus = self.read_cpu_status()
+        return self._control(template=const.S7_COLD_START, skip_mode="Run", min_length=18, force=force)
 
-        if cpuStatus.requestedMode != "Run":
-            request = bytearray(const.S7_COLD_START)
 
-            self._send(send_data=request)
-            data = self._recv()
-
-            length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-            if (length > 18): # the minimum expected
-                header_error_class, header_error_code = struct.unpack_from(f'BB', data, 17)
-                if header_error_class != const.ErrorClass.NO_ERROR or header_error_code != 0:
-                    return False
-        return True
-
-
-    def start_plc_hot(self) -> bool:
+    def start_plc_hot(self, force:bool=False) -> bool:
         """
         Start PLC hot (resume)
 
+        Args:
+            force(bool): send the command without checking the CPU status first
+
         Returns:
             status(bool): command result
                             True (success)
                             False (not executed)
         """
+        return self._control(template=const.S7_HOT_START, skip_mode="Run", min_length=18, force=force)
 
-        cpuStatus = self.read_cpu_status()
 
-        if cpuStatus.requestedMode != "Run":
-            request = bytearray(const.S7_HOT_START)
+    def _control(self, template:bytes, skip_mode:str, min_length:int, force:bool=False) -> bool:
+        """
+        Send a PLC control (stop/start) request
 
-            self._send(send_data=request)
-            data = self._recv()
+        Args:
+            template(bytes): control telegram
+            skip_mode(str): don't send if the CPU is already in this mode
+            min_length(int): minimum expected response length
+            force(bool): skip the CPU status check
 
-            length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-            if (length > 18): # the minimum expected
-                header_error_class, header_error_code = struct.unpack_from('BB', data, 17)
-                if header_error_class != const.ErrorClass.NO_ERROR or header_error_code != 0:
-                    return False
+        Returns:
+            status(bool): command result
+        """
+        # the mode may have changed without this client (key switch), never skip on a cached status
+        self.invalidate_cache(name='read_cpu_status')
+        if not force and self.read_cpu_status().requestedMode == skip_mode:
+            return True
+
+        self._send(send_data=template)
+        data = self._recv()
+        # mode is changing, drop any cached status
+        self.invalidate_cache(name='read_cpu_status')
+
+        length = len(data)
+        if (length > min_length): # the minimum expected
+            header_error_class, header_error_code = _HEADER_ERROR.unpack_from(data, 17)
+            if header_error_class != _CLASS_NO_ERROR or header_error_code != 0:
+                return False
         return True
 
 
@@ -659,50 +1046,61 @@ class Client:
             result(list): list of CPU LEDs status
         """
 
-        request = bytearray(const.S7_SZL_FIRST)
-        struct.pack_into(f'{self.endian}HH', request, 29, id, index)
+        request = _SZL_FIRST_HEAD + _U16x2.pack(id, index)
         
         self._send(send_data=request)
         data = self._recv()
 
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
+        length = len(data)
         if (length > 32): # the minimum expected
             (
                 pduRef, 
                 lastDataUnit,
                 param_error_code, 
-                data_return_code, 
-                transport_size, 
-                length
-            ) = struct.unpack_from(f'{self.endian}BBHBBH', data, 25)
-            fragmented_data = data[33:]
+                data_return_code
+            ) = _SZL_HEADER.unpack_from(data, 25)
+            # payload follows the 33 bytes of TPKT/COTP/S7 headers
+            if lastDataUnit == _LDU_YES:
+                # single telegram, copy once straight out of the receive buffer
+                return bytes(data[33:length])
+            fragmented_data = bytearray()
+            fragment = data[33:length]
+            # one continuation request patched per fragment, loop uses locals only
+            request_next = bytearray(const.S7_SZL_NEXT)
+            send = self._send
+            recv = self._recv
+            unpack_header = _SZL_HEADER.unpack_from
             # use lastDataUnit to iterate
-            while lastDataUnit != const.LastDataUnit.YES:
+            while lastDataUnit != _LDU_YES:
                 pduRef += 1
-                requestNext = bytearray(const.S7_SZL_NEXT)
-                struct.pack_into(f'{self.endian}H', requestNext, 11, pduRef)
-                try:
-                    self._send(send_data=requestNext)
-                except:
-                    break
-                data = self._recv()
+                _U16.pack_into(request_next, 11, pduRef)
+                send(send_data=request_next)
+                # copy out the previous fragment while the PLC prepares the next one
+                fragmented_data += fragment
+                fragment = b''
+                data = recv()
+                if (len(data) < 33):
+                    # timed out, returning what arrived so far would look like a complete list
+                    self.__log.error(f"self.read_szl(): Invalid PDU size")
+                    raise CommTypeError("Invalid PDU size")
                 (
                     pduRef, 
                     lastDataUnit, 
                     param_error_code, 
-                    data_return_code, 
-                    transport_size,
-                    length
-                ) = struct.unpack_from(f'{self.endian}BBHBBH', data, 25)
-                if (param_error_code == const.ParamErrorCode.NO_ERROR
-                    and data_return_code == const.ReturnCode.SUCCESS 
-                    and length > 0
+                    data_return_code
+                ) = unpack_header(data, 25)
+                payload_length = len(data) - 33
+                if (param_error_code == _NO_ERROR
+                    and data_return_code == _RC_SUCCESS 
+                    and payload_length > 0
                 ):
-                    fragmented_data += data[33:]
-            return fragmented_data
-        return data
+                    fragment = data[33:]
+            fragmented_data += fragment
+            return bytes(fragmented_data)
+        return bytes(data)
 
 
+    @_ttl_cache
     def read_protection(self) -> list:
         """
         Read CPU Protection levels
@@ -717,20 +1115,14 @@ class Client:
         totalLength = len(data)
         if totalLength < 4:
             return result
-        offset = 4
-        section_length, szlCount = struct.unpack_from(f'{self.endian}HH', data, offset)
-        offset += 4
-        for item in range(szlCount):
-            if offset + 12 > totalLength:
-                break
-            (
-                index, 
-                sch_schal, 
-                sch_par, 
-                sch_rel, 
-                bart_sch, 
-                anl_sch
-            ) = struct.unpack_from(f'{self.endian}HHHHHH', data, offset)
+        for (
+            index, 
+            sch_schal, 
+            sch_par, 
+            sch_rel, 
+            bart_sch, 
+            anl_sch
+        ) in _iter_szl_records(data, _PROTECTION_ITEM):
             result.append(
                 Protection(
                     protectionLevel=sch_schal, 
@@ -740,7 +1132,6 @@ class Client:
                     startupSwitch=util.get_startup_switch_selector(anl_sch)
                 )
             )
-            offset += section_length
         return result
 
 
@@ -760,38 +1151,32 @@ class Client:
             return result
 
         # extract data
-        offset = 4
-        section_length, szlCount = struct.unpack_from(f'{self.endian}HH', data, offset)
-        offset += 4
-        for item in range(szlCount):
-            if offset + 20 >= totalLength:
-                break
-            (
-                eventId, 
-                priority,
-                obNumber,
-                datId,
-                info1,
-                info2,
-                timestamp
-            ) = struct.unpack_from(f'{self.endian}2sBB2s2s4s8s', data, offset)
+        for (
+            eventId, 
+            priority,
+            obNumber,
+            datId,
+            info1,
+            info2,
+            timestamp
+        ) in _iter_szl_records(data, _DIAG_ITEM):
             result.append(
                 CPUDiagnostics(
-                    eventId=f"0x{eventId.hex()}",
-                    description=util.get_cpu_diagnostic(struct.unpack(f'{self.endian}H', eventId)[0]),
+                    eventId=f'0x{eventId:04x}',
+                    description=util.get_cpu_diagnostic(eventId),
                     priority=priority,
                     obNumber=obNumber,
-                    datId=f"0x{datId.hex()}",
-                    info1=f"0x{info1.hex()}",
-                    info2=f"0x{info2.hex()}",
+                    datId='0x' + datId.hex(),
+                    info1='0x' + info1.hex(),
+                    info2='0x' + info2.hex(),
                     timestamp=util.get_datetime(timestamp)
                 )
             )
-            offset += section_length
 
         return result
 
 
+    @_ttl_cache
     def read_cpu_leds(self) -> list:
         """
         Read CPU LEDs
@@ -809,17 +1194,7 @@ class Client:
             return result
 
         # extract data
-        offset = 4
-        section_length, szlCount = struct.unpack_from(f'{self.endian}HH', data, offset)
-        offset += 4
-        for item in range(szlCount):
-            if offset > totalLength:
-                break
-            (
-                id, 
-                status,
-                flashing,
-            ) = struct.unpack_from(f'{self.endian}HBB', data, offset)
+        for id, status, flashing in _iter_szl_records(data, _LED_ITEM):
             result.append(
                 CPULed(
                     rack=(id>>8)&0x07,
@@ -829,7 +1204,6 @@ class Client:
                     flashing=bool(flashing)
                 )
             )
-            offset += section_length
         return result
 
 
@@ -841,30 +1215,21 @@ class Client:
             block_type(int):
             block_number(int):
         """
+        # Block Type and Block Number as 5 ASCII digits, patched into one copy of the template
         request = bytearray(const.S7_BLOCK_INFO)
-
         request[30] = block_type & 0xFF
-        # Block Number
-        request[31] = ((block_number // 10000) + 0x30) & 0xFF
-        block_number = block_number % 10000
-        request[32] = ((block_number // 1000) + 0x30) & 0xFF
-        block_number = block_number % 1000
-        request[33] = ((block_number // 100) + 0x30) & 0xFF
-        block_number = block_number % 100
-        request[34] = ((block_number // 10) + 0x30) & 0xFF
-        block_number = block_number % 10
-        request[35] = ((block_number // 1) + 0x30) & 0xFF
+        request[31:36] = b'%05d' % (block_number % 100000)
 
         self._send(send_data=request)
         data = self._recv()
 
         result = []
 
-        length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
+        length = len(data)
         if (length > 32): # the minimum expected
-            param_error_code, data_return_code = struct.unpack_from(f'{self.endian}HB', data, 27)
-            if (param_error_code == const.ParamErrorCode.NO_ERROR 
-                and data_return_code == const.ReturnCode.SUCCESS
+            param_error_code, data_return_code = _PARAM_ERROR_RC.unpack_from(data, 27)
+            if (param_error_code == _NO_ERROR 
+                and data_return_code == _RC_SUCCESS
             ):
                 # IH IH: timestamps
                 (
@@ -888,10 +1253,9 @@ class Client:
                     version,
                     reserved,
                     checksum
-                ) = struct.unpack_from(f'{self.endian}1s B B H I I IH IH H H H H 8s 8s 8s B B 2s', data, 42)
-                versionHi, versionLo = util.byte_to_nibbles(version)
+                ) = _BLOCKINFO.unpack_from(data, 42)
                 blockInfo = BlockInfo(
-                    flags=f"0x{flags.hex()}",
+                    flags='0x' + flags.hex(),
                     language=util.get_block_language(language),
                     type=util.get_subblock_type(blockType),
                     number=number,
@@ -903,17 +1267,15 @@ class Client:
                     addLength=addLength,
                     localDataLength=localDataLength,
                     mc7Length=mc7_length,
-                    author=author.decode().rstrip('\x00'),
-                    family=family.decode().rstrip('\x00'),
-                    name=name.decode().rstrip('\x00'),
-                    version=f"{versionHi}.{versionLo}",
-                    checksum=f"0x{checksum.hex()}"
+                    author=author.rstrip(b'\x00').decode('latin-1'),
+                    family=family.rstrip(b'\x00').decode('latin-1'),
+                    name=name.rstrip(b'\x00').decode('latin-1'),
+                    version=f"{version >> 4}.{version & 0x0F}",
+                    checksum='0x' + checksum.hex()
                 )
                 result.append(blockInfo)
                 # update cache
-                if self.cache_data.get(blockInfo.type) is None:
-                    self.cache_data[blockInfo.type] = {}   
-                self.cache_data[blockInfo.type][blockInfo.number] = blockInfo
+                self.cache_data[(blockInfo.type, blockInfo.number)] = blockInfo
             else:
                 self.__log.error(f"self.read_block_info(): {ErrorCode(param_error_code)}")
                 raise ErrorCode(param_error_code)
@@ -923,6 +1285,26 @@ class Client:
         return result
 
 
+    def _get_mc7_length(self, area_name:str, number:int) -> int:
+        """
+        Get MC7 length of a block, reading its block info on first use.
+        Data writes don't change the block size, so it is kept until the
+        block info is read again or the connection is closed.
+
+        Args:
+            area_name(str): area name (e.g. "DB")
+            number(int):    block number
+        Returns:
+            mc7_length(int): MC7 length in bytes
+        """
+        key = (area_name, number)
+        block_info = self.cache_data.get(key)
+        if block_info is None:
+            self.read_block_info(block_type=const.BlockType.DB, block_number=number)
+            block_info = self.cache_data[key]
+        return block_info.mc7Length
+
+
     def read_area_raw(self, address:str, elements:int) -> list:
         """
         Read area and return raw bytes
@@ -933,135 +1315,157 @@ class Client:
         """
 
         result = []
-        # extract params from address
-        # extract area type
-        area_type = util.get_all_alpha(address=address)
-        # get numbers 
-        number_type = util.get_all_numeric(address=address)
+        # extract area type, numbers and area code
         try:
-            area = util.get_area_from_name(Name=area_type[0])
+            area_type, number_type, area = util.parse_address(address=address)
         except Exception as exception:
-            return Tag(
+            return [Tag(
                 address=address,
                 size=elements,
                 error=str(exception)
-            )
+            )]
 
         # get DB number
         db_number = number_type[0]
         offset = number_type[1]
 
-        # target S7300/S7400
-        if (self.controller < 1200):
-            try:
-                if self.cache_data.get(area_type[0]) is None:
-                    self.read_block_info(block_type=const.BlockType.DB, block_number=db_number)
-                elif self.cache_data.get(area_type[0]).get(db_number) is None:
-                    self.read_block_info(block_type=const.BlockType.DB, block_number=db_number)
-                mc7_length = self.cache_data.get(area_type[0]).get(db_number).mc7Length
-            except Exception:
-                mc7_length = elements
-                pass
+        # target S7300/S7400, only data blocks have a length to clamp to
+        if (self.controller < 1200 and area == const.Area.DB_DATABLOCKS):
+            block_info = self.cache_data.get((area_type[0], db_number))
+            mc7_length = None if block_info is None else block_info.mc7Length
+            if block_info is None and not self.trust_address_range:
+                try:
+                    mc7_length = self._get_mc7_length(area_name=area_type[0], number=db_number)
+                except Exception:
+                    pass
 
             # Resize elements if bigger than block
-            if offset + elements > mc7_length:
+            if mc7_length is not None and offset + elements > mc7_length:
                 elements = mc7_length - offset
 
-        # Some adjustment
-        if (area == const.Area.COUNTER_S7):
-            transport_size = const.DataType.COUNTER
-        elif (area == const.Area.TIMER_S7):
-            transport_size = const.DataType.TIMER
-        else:
-            transport_size = const.DataType.BYTE
+        # transport size, word size and addressing mode of the area
+        transport_size, word_size, address_shift, _ = _RAW_TRANSFER.get(area, _RAW_BYTE_TRANSFER)
 
-        # Calc Word size          
-        word_size = util.get_data_size_byte(transport_size)
-        if (word_size == 0):
-            self.__log.error(f"self.read_area(): Invalid Data Size")
-            raise DataTypeError("Invalid Data Size")
+        max_elements = self._max_read_bytes // word_size
+        if (max_elements <= 0):
+            # PDU length not negotiated yet, nothing could be split into requests
+            self.__log.error(f"self.read_area_raw(): Socket is not connected. Please use connect method")
+            raise CommTypeError("Socket is not connected. Please use connect method")
+        total_elements = elements
+        requests = 0
+        pending = {}    # PDU reference -> fragment index
 
-        if (transport_size == const.DataType.BIT):
-            elements = 1  # Only 1 bit can be transferred at time
-        else:
-            if (transport_size != const.DataType.COUNTER 
-                and transport_size != const.DataType.TIMER
-            ):
-                elements *= word_size
-                word_size = 1
-                transport_size = const.DataType.BYTE
+        # read only uses first 31 bytes, all fragments share one buffer
+        total_requests = -(-elements // max_elements) if elements > 0 else 0
+        if self._read_req_buf is None or len(self._read_req_buf) < 31 * total_requests:
+            self._read_req_buf = bytearray(const.S7_READ_WRITE[0:31]) * total_requests
+        request = self._read_req_buf
 
-        max_elements = (self._pdu_length - 18) // word_size # 18 = Reply telegram header
-        total_elements = elements
-        fragmented_data = bytes()
+        # loop invariants: only elements, address and reference change per fragment
+        item_db_number = db_number if area == const.Area.DB_DATABLOCKS else 0
 
+        # build every fragment up front so they can be pipelined
         while (total_elements > 0):
             number_of_elements = total_elements
             if (number_of_elements > max_elements):
                 number_of_elements = max_elements
 
-            # Setup the telegram
-            # read only uses first 31 bytes
-            request = bytearray(const.S7_READ_WRITE[0:31])
-            # Set Area
-            struct.pack_into('B', request, 27, area)
-            # Set DB Number
-            if (area == const.Area.DB_DATABLOCKS):
-                struct.pack_into(f'{self.endian}H', request, 25, db_number)
+            # Setup the telegram, only the reference and item change
+            start = 31 * requests
+            # Set PDU reference so replies can be matched
+            self._pdu_ref = (self._pdu_ref + 1) & 0xFFFF
+            _U16.pack_into(request, start + 11, self._pdu_ref)
+            pending[self._pdu_ref] = requests
 
             # Adjusts offset and word length
-            if (transport_size == const.DataType.BIT 
-                or transport_size == const.DataType.COUNTER
-                 or transport_size == const.DataType.TIMER
-            ):
-                address = offset
-                struct.pack_into('B', request, 22, transport_size)
-            else:
-                address = offset << 3
-
-            # Num elements
-            struct.pack_into(f'{self.endian}H', request, 23, number_of_elements)
-            # address into the PLC
-            struct.pack_into(
-                f'BBB', 
-                request, 
-                28, 
-                (address >> 16) & 0xFF,
-                (address >> 8) & 0xFF,
-                (address >> 0) & 0xFF
+            item_address = offset << address_shift
+
+            # transport size, num elements, DB number, area and address into the PLC
+            _REQUEST_ITEM.pack_into(
+                request,
+                start + 22,
+                transport_size,
+                number_of_elements,
+                item_db_number,
+                area,
+                (item_address >> 16) & 0xFF,
+                item_address & 0xFFFF
             )
+            requests += 1
+            total_elements -= number_of_elements
+            offset += number_of_elements * word_size
 
-            self._send(send_data=request)
+        fragments = [b''] * requests
+        request_view = memoryview(request)
+        sent = 0
+        received = 0
+        error = None
+        # keep up to max_amq_called requests in flight, on error only drain what was sent
+        while received < sent or (error is None and sent < requests):
+            if error is None and sent < requests and sent - received < self._max_amq_called:
+                burst = min(requests, received + self._max_amq_called)
+                self._send(send_data=request_view[31 * sent:31 * burst])
+                sent = burst
             data = self._recv()
+            received += 1
+            if error is not None:
+                continue
 
-            length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-            if (length < 25):
+            if (len(data) < 25):
                 self.__log.error(f"self.read_area(): Invalid PDU size")
-                raise CommTypeError("Invalid PDU size")
+                error = CommTypeError("Invalid PDU size")
+                continue
+            # whole reply header plus the (single) item header in one go
+            (
+                length,
+                pdu_ref,
+                header_error_class, 
+                header_error_code, 
+                param_function, 
+                param_item_count,
+                data_return_code,
+                data_transport_size,
+                data_item_length
+            ) = _READ_REPLY.unpack_from(data, 2)
+            index = pending.pop(pdu_ref, None)
+            if header_error_class != _CLASS_NO_ERROR or header_error_code != 0:
+                self.__log.error(f"self.read_area(): Invalid PDU size")
+                error = CommTypeError("Invalid PDU size")
+            elif index is None:
+                self.__log.error(f"self.read_area(): Unexpected PDU reference")
+                error = CommTypeError("Unexpected PDU reference")
             else:
-                (
-                    header_error_class, 
-                    header_error_code, 
-                    param_function, 
-                    param_item_count
-                ) = struct.unpack_from('BBBB', data, 17)
-                if header_error_class != const.ErrorClass.NO_ERROR or header_error_code != 0:
-                    self.__log.error(f"self.read_area(): Invalid PDU size")
-                    raise CommTypeError("Invalid PDU size")
-                else:
-                    for item in range(param_item_count):
-                        data_return_code, transport_size, length = struct.unpack_from(
-                            f'{self.endian}BBH', 
-                            data,
-                            21
-                        )
-                        if data_return_code == const.ReturnCode.SUCCESS:
-                            fragmented_data += data[25:]
-                        else:
-                            self.__log.error(f"self.read_area(): {ReturnCode(data_return_code)}")
-                            raise ReturnCode(data_return_code)
-            total_elements -= number_of_elements
-            offset += number_of_elements * word_size
+                # the first item header came with the reply header
+                item_offset = 21
+                parts = []
+                for item in range(param_item_count):
+                    if item > 0:
+                        if item_offset + 4 > len(data):
+                            break
+                        (
+                            data_return_code, 
+                            data_transport_size, 
+                            data_item_length
+                        ) = _DATA_ITEM_HEADER.unpack_from(data, item_offset)
+                    if data_return_code != _RC_SUCCESS:
+                        self.__log.error(f"self.read_area(): {ReturnCode(data_return_code)}")
+                        error = ReturnCode(data_return_code)
+                        break
+                    # bit/byte/int items report their length in bits
+                    if (data_transport_size == const.TransportSize.BIT
+                        or data_transport_size == const.TransportSize.BYTE_WORD_DWORD
+                        or data_transport_size == const.TransportSize.INT
+                    ):
+                        data_item_length = (data_item_length + 7) >> 3
+                    # copy out, the receive buffer is reused by the next fragment
+                    parts.append(bytes(data[item_offset + 4:item_offset + 4 + data_item_length]))
+                    # items are padded to even length
+                    item_offset += 4 + data_item_length + (data_item_length & 1)
+                fragments[index] = b''.join(parts)
+        if error is not None:
+            raise error
+
+        fragmented_data = b''.join(fragments)
 
         # return raw bytes
         result.append(
@@ -1086,19 +1490,15 @@ class Client:
             elements(int): specify how many bytes to write
         """
 
-        # extract params from address
-        # extract area type
-        area_type = util.get_all_alpha(address=address)
-        # get numbers 
-        number_type = util.get_all_numeric(address=address)
+        # extract area type, numbers and area code
         try:
-            area = util.get_area_from_name(Name=area_type[0])
+            area_type, number_type, area = util.parse_address(address=address)
         except Exception as exception:
-            return Tag(
+            return [Tag(
                 address=address,
-                size=elements,
+                size=len(raw_bytes),
                 error=str(exception)
-            )
+            )]
 
         # get DB number
         number = number_type[0]
@@ -1107,50 +1507,84 @@ class Client:
         # Generate total elements (bytes)
         elements = len(raw_bytes)
 
-        mc7_length = elements
-        if (self.controller < 1200):
-            try:
-                if self.cache_data.get(area_type[0]) is None:
-                    self.read_block_info(block_type=const.BlockType.DB, block_number=number)
-                elif self.cache_data.get(area_type[0]).get(number) is None:
-                    self.read_block_info(block_type=const.BlockType.DB, block_number=number)
-                mc7_length = self.cache_data.get(area_type[0]).get(number).mc7Length
-            except Exception:
-                pass
-
-        # Resize elements if bigger than block
-        if offset + elements > mc7_length:
-            elements = mc7_length - offset
-
-        # Some adjustment
-        if (area == const.Area.COUNTER_S7):
-            data_type = const.DataType.COUNTER
-        elif (area == const.Area.TIMER_S7):
-            data_type = const.DataType.TIMER
-        else:
-            data_type = const.DataType.BYTE
+        # target S7300/S7400, only data blocks have a length to clamp to
+        if (self.controller < 1200 and area == const.Area.DB_DATABLOCKS):
+            block_info = self.cache_data.get((area_type[0], number))
+            mc7_length = None if block_info is None else block_info.mc7Length
+            if block_info is None and not self.trust_address_range:
+                try:
+                    mc7_length = self._get_mc7_length(area_name=area_type[0], number=number)
+                except Exception:
+                    pass
 
-        # Calc Word size          
-        word_size = util.get_data_size_byte(data_type)
-        if (word_size == 0):
-            self.__log.error(f"self.write_area(): Invalid data size")
-            raise DataTypeError("Invalid Data Size")
+            # Resize elements if bigger than block
+            if mc7_length is not None and offset + elements > mc7_length:
+                elements = mc7_length - offset
 
-        if (data_type == const.DataType.BIT):
-            elements = 1  # Only 1 bit can be transferred at time
-        else:
-            if (data_type != const.DataType.COUNTER 
-                and data_type != const.DataType.TIMER
-            ):
-                elements *= word_size
-                word_size = 1
+        # transport sizes, word size and addressing mode of the area
+        data_type, word_size, address_shift, data_transport_size = _RAW_TRANSFER.get(area, _RAW_BYTE_TRANSFER)
 
-        tag = Tag(address=address, size=elements)
+        error = ''  # last error reported by the PLC, the result Tag is built once at the end
 
-        max_elements = (self._pdu_length - 35) // word_size # 35 = Reply telegram header
+        max_elements = self._max_write_bytes // word_size
+        if (max_elements <= 0):
+            # PDU length not negotiated yet, nothing could be split into requests
+            self.__log.error(f"self.write_area_raw(): Socket is not connected. Please use connect method")
+            raise CommTypeError("Socket is not connected. Please use connect method")
         total_elements = elements
         data_offset = 0
-        while (total_elements > 0):
+        payload = memoryview(raw_bytes)
+
+        # loop invariant: item DB number
+        item_number = number if area == const.Area.DB_DATABLOCKS else 0
+
+        # Write uses all 35 bytes, followed by the payload
+        if self._write_req_buf is None:
+            self._write_req_buf = bytearray(const.S7_READ_WRITE)
+            # Update function
+            self._write_req_buf[17] = const.Function.WRITE_VARIABLE
+        request = self._write_req_buf
+
+        pending = set()     # PDU references of writes awaiting a reply
+        sent = 0
+        received = 0
+        # keep up to max_amq_called writes in flight, replies only carry a status
+        while (received < sent or total_elements > 0):
+            if (total_elements <= 0 or sent - received >= self._max_amq_called):
+                data = self._recv()
+                received += 1
+
+                # a timed out reply comes back empty
+                if (len(data) < 2 + _WRITE_REPLY.size):
+                    length = 0
+                else:
+                    (
+                        length,
+                        pdu_ref,
+                        header_error_class, 
+                        header_error_code, 
+                        data_return_code
+                    ) = _WRITE_REPLY.unpack_from(data, 2)
+                if (length == 22):
+                    if (pdu_ref not in pending):
+                        self.__log.error(f"self.write_area(): Unexpected PDU reference")
+                        error = "Unexpected PDU reference"
+                    elif (header_error_class != _CLASS_NO_ERROR
+                        or header_error_code != 0x00
+                    ):
+                        self.__log.error(f"self.write_area(): {ErrorClass(header_error_class)}")
+                        error = str(ErrorClass(header_error_class))
+                        # raise ErrorClass(header_error_class)
+                    elif (data_return_code != _RC_SUCCESS):
+                        self.__log.error(f"self.write_area(): {ReturnCode(data_return_code)}")
+                        error = str(ReturnCode(data_return_code))
+                    pending.discard(pdu_ref)
+                else:
+                    self.__log.error(f"self.write_area(): Invalid PDU size")
+                    error = "Invalid PDU size"
+                    # raise CommTypeError("Invalid PDU size")
+                continue
+
             number_of_elements = total_elements
             if (number_of_elements > max_elements):
                 number_of_elements = max_elements
@@ -1158,88 +1592,48 @@ class Client:
             data_size = number_of_elements * word_size
             iso_size = 35 + data_size
 
-            # Setup the telegram
-            # Write uses all 35 bytes
-            request = bytearray(const.S7_READ_WRITE)
+            # Setup the telegram, only sizes, reference and item change
             # Set telegram size
-            struct.pack_into(f'{self.endian}H', request, 2, iso_size)
+            _U16.pack_into(request, 2, iso_size)
+            # Set PDU reference so replies can be matched
+            self._pdu_ref = (self._pdu_ref + 1) & 0xFFFF
+            _U16.pack_into(request, 11, self._pdu_ref)
+            pending.add(self._pdu_ref)
             # Data Length
             data_length = data_size + 4
-            struct.pack_into(f'{self.endian}H', request, 15, data_length)
-            # Update function
-            request[17] = const.Function.WRITE_VARIABLE
-            # Set Area
-            struct.pack_into('B', request, 27, area)
-            # Set DB number
-            if (area == const.Area.DB_DATABLOCKS):
-                struct.pack_into(f'{self.endian}H', request, 25, number)
+            _U16.pack_into(request, 15, data_length)
 
             # Adjusts offset and word length
-            if (data_type == const.DataType.BIT 
-                or data_type == const.DataType.COUNTER
-                 or data_type == const.DataType.TIMER
-            ):
-                address = offset
-                data_length = data_size
-                request[22] = data_type
-            else:
-                address = offset << 3
-                data_length = data_size << 3
-
-            # Num elements
-            struct.pack_into(f'{self.endian}H', request, 23, number_of_elements)
-            # Set address
-            struct.pack_into(
-                f'BBB', 
-                request, 
-                28, 
-                (address >> 16) & 0xFF,
-                (address >> 8) & 0xFF,
-                (address >> 0) & 0xFF
+            item_address = offset << address_shift
+            data_length = data_size << address_shift
+
+            # transport size, num elements, DB number, area and address
+            _REQUEST_ITEM.pack_into(
+                request,
+                22,
+                data_type,
+                number_of_elements,
+                item_number,
+                area,
+                (item_address >> 16) & 0xFF,
+                item_address & 0xFFFF
             )
 
             # Set transport size and data length
-            if (data_type == const.DataType.BIT):
-                request[32] = const.TransportSize.BIT
-            elif (data_type == const.DataType.COUNTER or data_type == const.DataType.TIMER):
-                request[32] = const.TransportSize.OCTET_STRING
-            else:
-                request[32] = const.TransportSize.BYTE_WORD_DWORD
-            struct.pack_into(f'{self.endian}H', request, 33, data_length)
+            _DATA_ITEM_HEADER.pack_into(request, 31, 0x00, data_transport_size, data_length)
 
-            # attach payload to write request
-            request += raw_bytes[data_offset:data_offset+data_size]
-
-            self._send(send_data=request)
-            try:
-                data = self._recv()
-            except:
-                pass
-
-            length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-            if (length == 22):
-                header_error_class, header_error_code = struct.unpack_from('BB', data, 17)
-                data_return_code = struct.unpack_from('B', data, 21)
-                if (header_error_class != const.ErrorClass.NO_ERROR
-                    and header_error_code != 0x00
-                    and data_return_code != const.ReturnCode.SUCCESS
-                ):
-                    self.__log.error(f"self.write_area(): {ErrorClass(header_error_class)}")
-                    tag = tag._replace(error=ErrorClass(header_error_class))
-                    # raise ErrorClass(header_error_class)
-            else:
-                self.__log.error(f"self.write_area(): Invalid PDU size")
-                tag = tag._replace(error="Invalid PDU size")
-                # raise CommTypeError("Invalid PDU size")
+            # payload goes out straight from the caller's buffer
+            self._send(send_data=request, tail=(payload[data_offset:data_offset+data_size],))
+            sent += 1
 
             total_elements -= number_of_elements
             offset += number_of_elements * word_size
             data_offset += number_of_elements * word_size
 
-        return [tag]
+        return [Tag(address=address, size=elements, error=error)]
 
 
-    def read_area(self, item_list:list=[]) -> list:
+    def read_area(self, item_list:list=None) -> list:
         """
         Read data area
 
@@ -1249,376 +1643,568 @@ class Client:
             result(list): same list of items as input but with values       
         """
 
-        # result = []
-        request = bytearray(const.S7_READ_WRITE[0:19]) # up to item count
-
-        item_size = 12 # bytes
-        item_count = 0
-        total_pdu = 0
-        previous_index = 0
+        if not item_list:
+            return []
 
-        total_items = len(item_list)
-        result = [Tag()] * total_items
-        total_items_index = 0
-        while total_items_index < total_items:
+        request = bytearray(_READ_WRITE_HEAD) # up to item count
+        batch = []      # indexes of the items packed into the pending request
+        pdu_length = self._pdu_length
+        last_index = len(item_list) - 1
+        result = list(item_list)
+        for index, item in enumerate(item_list):
             try:
-                # extract item
-                item = item_list[total_items_index]
-                result[total_items_index] = item
-                # extract area type
-                skip = False
-                area_type = util.get_all_alpha(address=item.address)
-                try:
-                    area = util.get_area_from_name(Name=area_type[0])
-                except Exception as exception:
-                    item = item._replace(error=str(exception))
-                    skip = True
-
                 # string is its own BS
-                if item.type == const.DataType.STRING and not skip:
-                    # read first half to determine if more reading is needed
-                    response = self.read_area_raw(address=item.address, elements=128)
-                    # parse buffer
-                    (
-                        max_length, 
-                        string_length, 
-                        string_value
-                    ) = struct.unpack("BB126s", response[0].value)
-                    if string_length > 126:
-                        area = util.get_all_alpha(address=item.address)
-                        number = util.get_all_numeric(address=item.address)
-                        remaining_elements = string_length - 126
-                        # new offset is orignal offset + remaining + first 2 string bytes
-                        index_offset = number[1] + remaining_elements
-                        address_offset = f'{area[0]}{number[0]}.{area[1]}{index_offset}.{number[2]}'
-                        response = self.read_area_raw(address=address_offset, elements=remaining_elements)
-                        string_value += response[0].value
-                    item = item._replace(
-                        value=string_value[:string_length].decode(), 
-                        size=string_length
-                    )
-                    skip = True
-
-                if skip:
-                    result[total_items_index] = item
-                    total_items_index += 1
-                    continue
-
-                total_items_index += 1
-                # get item length
-                item_length = util.get_data_size_byte(item.type)
-                # batch read
-                item_count += 1
-                total_pdu = 2 + (item_count * item_size)
-                if total_pdu + 2 < self._pdu_length:
-                    # extract area type
-                    # get numbers 
-                    number_type = util.get_all_numeric(address=item.address)
-                    # get DB number
-                    db_number = number_type[0]
+                if item.type == _TYPE_STRING:
+                    result[index] = self._read_string(item=item)
+                else:
+                    area_type, number_type, area = util.parse_address(address=item.address)
                     # get transport size
-                    if (area == const.Area.COUNTER_S7):
-                        transport_size = const.DataType.COUNTER
-                    elif (area == const.Area.TIMER_S7):
-                        transport_size = const.DataType.TIMER
+                    if (area == _AREA_COUNTER):
+                        transport_size = _TYPE_COUNTER
+                    elif (area == _AREA_TIMER):
+                        transport_size = _TYPE_TIMER
                     else:
                         transport_size = item.type
-                        if transport_size != const.DataType.BIT:
-                            transport_size = const.DataType.BYTE
+                        if transport_size != _TYPE_BIT:
+                            transport_size = _TYPE_BYTE
 
                     # calculate address
                     # byte address + bit address
-                    address = (number_type[1] << 3) + number_type[2]
-                    address_bytes = struct.pack(
-                        'BBB',
-                        (address >> 16) & 0xFF,
-                        (address >> 8) & 0xFF,
-                        (address >> 0) & 0xFF
-                    )
-                    item_info = struct.pack(
-                        f'{self.endian}BBBBHHB', 
+                    address = ((number_type[1] << 3) + number_type[2]) & 0xFFFFFF
+                    request += _ITEM_SPEC.pack(
                         0x12, # variable specifications
                         0x0A, # length of address specification
                         0x10, # syntax id: S7ANY
                         transport_size, 
-                        item_length,
-                        db_number,
-                        area
+                        util.DATA_SIZE_BYTE.get(item.type, 0),
+                        number_type[0],
+                        area,
+                        address >> 16,
+                        address & 0xFFFF
                     )
-                    request += (item_info + address_bytes)
-                # see if max PDU length has been exceed or that end of items list
-                if total_pdu + item_size >= self._pdu_length or total_items_index >= total_items:
-                    request[18] = item_count
-                    # param length = (param_function + param_item_count) + items*12
-                    header_param_length = total_pdu
-                    struct.pack_into(f'{self.endian}H', request, 13, header_param_length)
-                    tpkt_length = 17 + header_param_length
-                    struct.pack_into(f'{self.endian}H', request, 2, tpkt_length)
-                    # send request
-                    self._send(send_data=request)
-                    # reset param afer sending
-                    total_pdu = 0
-                    item_count = 0
-                    request = bytearray(const.S7_READ_WRITE[0:19]) # up to item count
-                    data = self._recv()
-                    # parse up to this message
-                    tpkt_length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-                    if (tpkt_length < 25):
-                        self.__log.error(f"self.read_area(): Invalid PDU size")
-                        raise CommTypeError("Invalid PDU size")
-                    else:
-                        (
-                            header_error_class, 
-                            header_error_code, 
-                            param_function, 
-                            param_item_count
-                        ) = struct.unpack_from('BBBB', data, 17)
-                        if header_error_class != const.ErrorClass.NO_ERROR or header_error_code != 0:
-                            self.__log.error(f"self.read_area(): Invalid PDU size")
-                            raise CommTypeError("Invalid PDU size")
-                        else:
-                            # match item from main loop
-                            item_offset = 21 # index 0
-                            data_offset = item_offset + 4
-                            for parse_index in range(previous_index, total_items_index):
-                                # string has been handled, so skip
-                                if (
-                                    item_list[parse_index].type != const.DataType.STRING
-                                    and result[parse_index].error == ''
-                                ):
-                                    (
-                                        data_return_code, 
-                                        data_transport_size, 
-                                        data_item_length
-                                    ) = struct.unpack_from(
-                                        f'{self.endian}BBH', 
-                                        data,
-                                        item_offset
-                                    )
-                                    if data_item_length > 0:
-                                        if (
-                                            item_list[parse_index].type != const.DataType.BIT
-                                            and item_list[parse_index].type != const.DataType.COUNTER
-                                            and item_list[parse_index].type != const.DataType.TIMER
-                                        ):
-                                            data_item_length = data_item_length >> 3
-                                        value = util.decode(
-                                            data=data, 
-                                            item_type=item_list[parse_index].type,
-                                            offset=data_offset,
-                                            endian=self.endian
-                                        )
-                                        item_offset += (4 + data_item_length)
-                                        # padding for odd bytes
-                                        if bool(data_item_length & 1):
-                                            item_offset += 1
-                                        data_offset = item_offset + 4
-                                        result[parse_index] = result[parse_index]._replace(
-                                            value=value, 
-                                            size=data_item_length
-                                        )
-                                    if data_return_code != const.ReturnCode.SUCCESS:
-                                        result[parse_index] = result[parse_index]._replace(
-                                            error=str(ReturnCode(data_return_code))
-                                        )
-                    previous_index = total_items_index
+                    batch.append(index)
             except Exception as exception:
-                item = item._replace(error=str(exception))
-                result[total_items_index] = item
+                result[index] = item._replace(error=str(exception))
+
+            # send once the next item would exceed the PDU or at the end of items list
+            # param length = (param_function + param_item_count) + items*12
+            if batch and (index == last_index or 2 + (len(batch) + 1) * 12 >= pdu_length):
+                try:
+                    self._read_area_batch(request=request, batch=batch, item_list=item_list, result=result)
+                except Exception as exception:
+                    for batch_index in batch:
+                        result[batch_index] = item_list[batch_index]._replace(error=str(exception))
+                # keep the header, every patched field is rewritten before the next send
+                del request[19:]
+                batch.clear()
 
         return result
 
 
-    def write_area(self, item_list:list=[]) -> list:
+    def _read_string(self, item:Tag) -> Tag:
         """
-        Write data area
+        Read a single STRING item
+
+        Args:
+            item(Tag): string item to be read
+        Returns:
+            item(Tag): item with value and size
+        """
+
+        area_type, number_type, area = util.parse_address(address=item.address)
+        # header (max length, actual length) and the first characters
+        response = self.read_area_raw(address=item.address, elements=2 + self.small_string_threshold)
+        if response[0].error:
+            return item._replace(error=response[0].error)
+        string_length = response[0].value[1]
+        string_value = response[0].value[2:2 + string_length]
+        if string_length > len(string_value):
+            # read exactly the rest, it starts after the header and characters already read
+            index_offset = number_type[1] + 2 + len(string_value)
+            address_offset = f'{area_type[0]}{number_type[0]}.{area_type[1]}{index_offset}.{number_type[2]}'
+            response = self.read_area_raw(
+                address=address_offset, 
+                elements=string_length - len(string_value)
+            )
+            if response[0].error:
+                return item._replace(error=response[0].error)
+            string_value += response[0].value
+        # S7 STRING characters are single bytes
+        return item._replace(
+            value=string_value.decode('latin-1'), 
+            size=string_length
+        )
+
+
+    def _read_area_batch(self, request:bytearray, batch:list, item_list:list, result:list):
+        """
+        Send one read request and parse its reply into result
+
+        Args:
+            request(bytearray): telegram header followed by one spec per batch item
+            batch(list): indexes into item_list, in request order
+            item_list(list): items passed to read_area
+            result(list): read_area result, updated in place
+        """
+
+        request[18] = len(batch)
+        header_param_length = 2 + (len(batch) * 12)
+        _U16.pack_into(request, 13, header_param_length)
+        _U16.pack_into(request, 2, 17 + header_param_length)
+        self._send(send_data=request)
+        data = self._recv()
+        # parse up to this message
+        if (len(data) < 25):
+            self.__log.error(f"self.read_area(): Invalid PDU size")
+            raise CommTypeError("Invalid PDU size")
+        # header error class and code
+        if data[17] != _CLASS_NO_ERROR or data[18] != 0:
+            self.__log.error(f"self.read_area(): Invalid PDU size")
+            raise CommTypeError("Invalid PDU size")
+
+        endian = self.endian
+        get_decoder = util.get_decoder
+        item_offset = 21 # index 0
+        for index in batch:
+            item = item_list[index]
+            (
+                data_return_code, 
+                data_transport_size, 
+                data_item_length
+            ) = _DATA_ITEM_HEADER.unpack_from(data, item_offset)
+            if item.type not in _LENGTH_IN_BYTES:
+                data_item_length >>= 3
+            if data_return_code != _RC_SUCCESS:
+                result[index] = item._replace(error=_RETURN_CODE_TEXT[data_return_code])
+            elif data_item_length > 0:
+                # same as util.decode, without a call per item
+                unpacker, convert = get_decoder(item_type=item.type, endian=endian)
+                value = unpacker.unpack_from(data, item_offset + 4)[0]
+                if convert is not None:
+                    value = convert(value, endian)
+                result[index] = Tag(
+                    name=item.name,
+                    address=item.address,
+                    value=value, 
+                    size=data_item_length,
+                    type=item.type
+                )
+            # failed items still have a 4 byte header, odd data is padded
+            item_offset += 4 + data_item_length + (data_item_length & 1)
+
+
+    def read_multi(self, item_list:list=None) -> list:
+        """
+        Read data area, merging items that sit close together in the same
+        area/data block into a single raw read. Items that can't be merged
+        (strings, counters, timers, lone items) are read with read_area.
 
         Args:
             item_list(list): list of items to be requested
         Returns:
-            result(list): same list of items as input but with values       
+            result(list): same list of items as input but with values
         """
 
-        request = bytearray(const.S7_READ_WRITE[0:19]) # up to item count
-        data_payload = bytearray()
-        item_count = 0
-        total_pdu = 0
-        previous_index = 0
+        if not item_list:
+            return []
+        result = list(item_list)
+        # polling loops read the same items over and over, plan once per shape
+        shape = (self.coalesce_gap, tuple((item.address, item.type) for item in item_list))
+        plan = self._multi_plans.get(shape)
+        if plan is None:
+            plan = self._plan_multi(item_list=item_list)
+            if len(self._multi_plans) >= self._MULTI_PLAN_CACHE_SIZE:
+                del self._multi_plans[next(iter(self._multi_plans))]
+            self._multi_plans[shape] = plan
+        groups, fallback = plan
+        fallback = list(fallback)
+
+        for address, elements, runs in groups:
+            try:
+                buffer = self.read_area_raw(address=address, elements=elements)[0].value
+            except Exception:
+                # let read_area report the error per item
+                fallback.extend(index for run in runs for index, size in run[3])
+                continue
+            for offset, end, item_type, members in runs:
+                if end > len(buffer):
+                    fallback.extend(index for index, size in members)
+                elif item_type == const.DataType.BIT:
+                    index, bit = members[0]
+                    item = item_list[index]
+                    result[index] = Tag(
+                        name=item.name,
+                        address=item.address,
+                        value=bool((buffer[offset] >> bit) & 0x01),
+                        size=1,
+                        type=item.type
+                    )
+                else:
+                    values = util.decode_array(
+                        data=buffer,
+                        item_type=item_type,
+                        count=len(members),
+                        offset=offset,
+                        endian=self.endian
+                    )
+                    for (index, size), value in zip(members, values):
+                        item = item_list[index]
+                        result[index] = Tag(
+                            name=item.name,
+                            address=item.address,
+                            value=value,
+                            size=size,
+                            type=item_type
+                        )
+
+        if fallback:
+            fallback.sort()
+            response = self.read_area(item_list=[item_list[index] for index in fallback])
+            for index, item in zip(fallback, response):
+                result[index] = item
+
+        return result
+
+
+    def _plan_multi(self, item_list:list) -> tuple:
+        """
+        Work out which raw reads serve a read_multi item list
+
+        Args:
+            item_list(list): list of items to be requested
+        Returns:
+            plan(tuple): (groups, fallback) where groups is a list of
+                (address, elements, runs) raw reads, each run being
+                (offset, end, type, members) decoded in one go, and fallback
+                the indexes read through read_area
+        """
 
-        total_items = len(item_list)
-        result = [Tag()] * total_items 
-        total_items_index = 0
-        while total_items_index < total_items:
+        ranges = {}     # (area name, area, db number) -> [(start, end, index, bit)]
+        fallback = []   # indexes read through read_area
+
+        for index, item in enumerate(item_list):
+            size = util.DATA_SIZE_BYTE.get(item.type, 0)
+            if (size == 0
+                or item.type == const.DataType.STRING
+                or item.type == const.DataType.COUNTER
+                or item.type == const.DataType.TIMER
+            ):
+                fallback.append(index)
+                continue
             try:
-                # extract item
-                item = item_list[total_items_index]
-                item = item._replace(error="Not Sent")
-                result[total_items_index] = item
-                # extract area type
-                skip = False
-                area_type = util.get_all_alpha(address=item.address)
-                try:
-                    area = util.get_area_from_name(Name=area_type[0])
-                except Exception as exception:
-                    item = item._replace(error=str(exception))
-                    skip = True
+                area_type, number_type, area = util.parse_address(address=item.address)
+            except Exception:
+                fallback.append(index)
+                continue
+            # raw reads only address a block number in DB, an instance DB would read DI 0
+            if (area == const.Area.COUNTER_S7
+                or area == const.Area.TIMER_S7
+                or area == const.Area.DI_DB_INSTANCE
+            ):
+                fallback.append(index)
+                continue
+            start = number_type[1]
+            ranges.setdefault((area_type[0], area, number_type[0]), []).append(
+                (start, start + size, index, number_type[2])
+            )
 
-                if item.value is None:
-                    item = item._replace(error="Missing Value")
-                    skip = True
+        groups = []
+        for (area_name, area, db_number), spans in ranges.items():
+            # merge spans whose gap is small enough to read through
+            spans.sort()
+            merged = []
+            for span in spans:
+                if merged and span[0] <= merged[-1][1] + self.coalesce_gap:
+                    merged[-1][1] = max(merged[-1][1], span[1])
+                    merged[-1][2].append(span)
+                else:
+                    merged.append([span[0], span[1], [span]])
 
-                # string is its own BS
-                if item.type == const.DataType.STRING and not skip:
-                    string_length = len(item.value)
-                    string_value = item.value
-                    if string_length > 254:
-                        string_length = 254
-                        string_value = string_value[:string_length]
-                    item = item._replace(value=string_value, size=string_length)
-                    response = self.write_area_raw(
-                        address=item.address, 
-                        raw_bytes=util.encode(item=item, endian=self.endian)
-                    )
-                    item = item._replace(error=response[0].error)
-                    skip = True
+            for start, end, members in merged:
+                if len(members) == 1:
+                    fallback.append(members[0][2])
+                    continue
+                if area == const.Area.DB_DATABLOCKS:
+                    address = f"{area_name}{db_number}.DBX{start}.0"
+                else:
+                    address = f"{area_name}{start}.0"
+                # back to back items of the same type are decoded in one go
+                runs = []
+                for item_start, item_end, index, bit in members:
+                    item_type = item_list[index].type
+                    if item_type == const.DataType.BIT:
+                        runs.append((item_start - start, item_end - start, item_type, [(index, bit)]))
+                    elif (runs
+                        and runs[-1][2] == item_type
+                        and runs[-1][1] == item_start - start
+                    ):
+                        run = runs[-1]
+                        run[3].append((index, item_end - item_start))
+                        runs[-1] = (run[0], item_end - start, item_type, run[3])
+                    else:
+                        runs.append((item_start - start, item_end - start, item_type, [(index, item_end - item_start)]))
+                groups.append((address, end - start, runs))
+
+        return groups, fallback
+
+
+    def write_multi(self, item_list:list=None) -> list:
+        """
+        Write data area, merging back to back items of the same numeric type
+        in the same area/data block into a single raw write. Other items are
+        written with write_area.
+
+        Args:
+            item_list(list): list of items to be written
+        Returns:
+            result(list): same list of items as input but with error update
+        """
 
-                if skip:
-                    result[total_items_index] = item
-                    total_items_index += 1
+        if not item_list:
+            return []
+        result = list(item_list)
+        ranges = {}     # (area name, area, db number) -> [(start, end, index)]
+        fallback = []   # indexes written through write_area
+
+        for index, item in enumerate(item_list):
+            if (item.value is None
+                or not util.is_array_type(item.type)
+                or item.type == _TYPE_COUNTER
+                or item.type == _TYPE_TIMER
+            ):
+                fallback.append(index)
+                continue
+            try:
+                area_type, number_type, area = util.parse_address(address=item.address)
+            except Exception:
+                fallback.append(index)
+                continue
+            # raw writes only address a block number in DB, an instance DB would write DI 0
+            if (area == const.Area.COUNTER_S7
+                or area == const.Area.TIMER_S7
+                or area == const.Area.DI_DB_INSTANCE
+            ):
+                fallback.append(index)
+                continue
+            start = number_type[1]
+            ranges.setdefault((area_type[0], area, number_type[0]), []).append(
+                (start, start + util.DATA_SIZE_BYTE[item.type], index)
+            )
+
+        for (area_name, area, db_number), spans in ranges.items():
+            # only merge items that touch, a gap would overwrite PLC data
+            spans.sort()
+            runs = []
+            for span in spans:
+                if (runs
+                    and span[0] == runs[-1][-1][1]
+                    and item_list[span[2]].type == item_list[runs[-1][-1][2]].type
+                ):
+                    runs[-1].append(span)
+                else:
+                    runs.append([span])
+
+            for run in runs:
+                if len(run) == 1:
+                    fallback.append(run[0][2])
                     continue
+                start = run[0][0]
+                if area == const.Area.DB_DATABLOCKS:
+                    address = f"{area_name}{db_number}.DBX{start}.0"
+                else:
+                    address = f"{area_name}{start}.0"
+                try:
+                    raw_bytes = util.encode_array(
+                        values=[item_list[index].value for _, _, index in run],
+                        item_type=item_list[run[0][2]].type,
+                        endian=self.endian
+                    )
+                    written = self.write_area_raw(address=address, raw_bytes=raw_bytes)[0]
+                except Exception:
+                    # let write_area report the error per item
+                    fallback.extend(index for _, _, index in run)
+                    continue
+                for item_start, item_end, index in run:
+                    if item_end - start > written.size:
+                        # cut off at the end of the data block, let write_area report the error
+                        fallback.append(index)
+                    else:
+                        result[index] = item_list[index]._replace(error=str(written.error), size=item_end - item_start)
+
+        if fallback:
+            fallback.sort()
+            response = self.write_area(item_list=[item_list[index] for index in fallback])
+            for index, item in zip(fallback, response):
+                result[index] = item
+
+        return result
+
+
+    def write_area(self, item_list:list=None) -> list:
+        """
+        Write data area
 
-                # get item length
-                data_item_length = util.get_data_size_byte(item.type)
+        Args:
+            item_list(list): list of items to be requested
+        Returns:
+            result(list): same list of items as input but with values       
+        """
 
-                if total_items_index < total_items:
-                    next_item_size = util.calculate_write_item_size(item_list[total_items_index])
+        if not item_list:
+            return []
+
+        request = bytearray(_READ_WRITE_HEAD) # up to item count
+        request[17] = const.Function.WRITE_VARIABLE
+        data_payload = []   # encoded data items, joined once per PDU
+        batch = []          # indexes of the items packed into the pending request
+        total_pdu = 0
+        endian = self.endian
+        pdu_length = self._pdu_length
+        last_index = len(item_list) - 1
+        result = list(item_list)
+        # param + data bytes of each item, needed for the item itself and as look ahead
+        item_sizes = [util.calculate_write_item_size(item) for item in item_list]
+        for index, item in enumerate(item_list):
+            try:
+                if item.value is None:
+                    result[index] = item._replace(error="Missing Value")
+                # string is its own BS
+                elif item.type == _TYPE_STRING:
+                    result[index] = self._write_string(item=item)
                 else:
-                    next_item_size = util.calculate_write_item_size(item_list[total_items_index-1])
-
-                # message must not exceed total PDU length
-                send = True
-                # frame_header (up to item count) + current_pdu + next_item
-                if 19 + total_pdu + next_item_size < self._pdu_length:
-                    send = False
-                    total_pdu += util.calculate_write_item_size(item)
-                    total_items_index += 1
-                    item_count += 1
-                    # get numbers 
-                    number_type = util.get_all_numeric(address=item.address)
+                    area_type, number_type, area = util.parse_address(address=item.address)
+                    # get item length
+                    data_item_length = util.DATA_SIZE_BYTE.get(item.type, 0)
                     # get transport size
-                    if (area == const.Area.COUNTER_S7):
-                        transport_size = const.DataType.COUNTER
-                    elif (area == const.Area.TIMER_S7):
-                        transport_size = const.DataType.TIMER
+                    if (area == _AREA_COUNTER):
+                        transport_size = _TYPE_COUNTER
+                    elif (area == _AREA_TIMER):
+                        transport_size = _TYPE_TIMER
                     else:
                         transport_size = item.type
-                        if transport_size != const.DataType.BIT:
-                            transport_size = const.DataType.BYTE
+                        if transport_size != _TYPE_BIT:
+                            transport_size = _TYPE_BYTE
 
-                    # get DB number
-                    db_number = number_type[0]
                     # calculate address
                     # byte address + bit address
-                    address = (number_type[1] << 3) + number_type[2]
-                    address_bytes = struct.pack(
-                        'BBB',
-                        (address >> 16) & 0xFF,
-                        (address >> 8) & 0xFF,
-                        (address >> 0) & 0xFF
-                    )
-                    item_info = struct.pack(
-                        f'{self.endian}BBBBHHB', 
+                    address = ((number_type[1] << 3) + number_type[2]) & 0xFFFFFF
+                    item_spec = _ITEM_SPEC.pack(
                         0x12, # variable specifications
                         0x0A, # length of address specification
                         0x10, # syntax id: S7ANY
                         transport_size, 
                         data_item_length,
-                        db_number,
-                        area
+                        number_type[0],
+                        area,
+                        address >> 16,
+                        address & 0xFFFF
                     )
-                    request += (item_info + address_bytes)
-                    # set data transport size
                     # Set transport size and data length
-                    if (transport_size == const.DataType.BIT):
-                        transport_size = const.TransportSize.BIT
-                        corrected_data_item_length = data_item_length
-                    elif (transport_size == const.DataType.COUNTER or transport_size == const.DataType.TIMER):
-                        transport_size = const.TransportSize.OCTET_STRING
-                        corrected_data_item_length = data_item_length + 1
-                    else:
-                        transport_size = const.TransportSize.BYTE_WORD_DWORD
-                        corrected_data_item_length = data_item_length << 3
-                    data_payload += (
-                        struct.pack(
-                            f'{self.endian}BBH', 
-                            const.ReturnCode.RESERVED,
-                            transport_size,
-                            corrected_data_item_length
-                        ) + util.encode(item=item, endian=self.endian)
+                    data_transport_size, length_shift, length_extra = _WRITE_DATA_TRANSPORT[transport_size]
+                    data_item = util.encode(item=item, endian=endian)
+                    # only batch the item once it encoded cleanly
+                    request += item_spec
+                    data_payload.append(
+                        _DATA_ITEM_HEADER.pack(
+                            _RC_RESERVED,
+                            data_transport_size,
+                            (data_item_length << length_shift) + length_extra
+                        )
                     )
-
-                # see if max PDU length has been exceed or that end of items list
-                if send or total_items_index >= total_items:
-                    # update parameter
-                    request[17] = const.Function.WRITE_VARIABLE
-                    request[18] = item_count
-                    # append data
-                    request += data_payload
-                    header_param_length = 2 + (item_count * 12)
-                    struct.pack_into(f'{self.endian}H', request, 13, header_param_length)
-                    header_data_length = len(data_payload)
-                    struct.pack_into(f'{self.endian}H', request, 15, header_data_length)
-                    tpkt_length = 17 + header_param_length + header_data_length
-                    struct.pack_into(f'{self.endian}H', request, 2, tpkt_length)
-                    # send request
-                    self._send(send_data=request)
-                    # reset param afer sending
-                    total_pdu = 0
-                    item_count = 0
-                    request = bytearray(const.S7_READ_WRITE[0:19]) # up to item count
-                    data_payload = bytearray()
-                    data = self._recv()
-                    # parse up to this message
-                    tpkt_length = struct.unpack_from(f'{self.endian}H', data, 2)[0]
-                    # minimum is 1 response
-                    if (tpkt_length < 22):
-                        self.__log.error(f"self.write_area(): Invalid PDU size")
-                        raise CommTypeError("Invalid PDU size")
-                    else:
-                        (
-                            header_error_class, 
-                            header_error_code, 
-                            param_function, 
-                            param_item_count
-                        ) = struct.unpack_from('BBBB', data, 17)
-                        if header_error_class != const.ErrorClass.NO_ERROR or header_error_code != 0:
-                            self.__log.error(f"self.write_area(): Invalid PDU size")
-                            raise CommTypeError("Invalid PDU size")
-                        else:
-                            # match item from main loop
-                            data_offset = 21 # index 0
-                            for parse_index in range(previous_index, total_items_index):
-                                # string has been handled, so skip
-                                if (
-                                    item_list[parse_index].type != const.DataType.STRING 
-                                    and item_list[parse_index].value != None
-                                    and result[parse_index].error == ''
-                                ):
-                                    data_return_code = struct.unpack_from(
-                                        'B', 
-                                        data,
-                                        data_offset
-                                    )[0]
-                                    if data_return_code != const.ReturnCode.SUCCESS:
-                                        result[parse_index] = result[parse_index]._replace(
-                                            error=str(ReturnCode(data_return_code))
-                                        )
-                                    else:
-                                        result[parse_index] = result[parse_index]._replace(error='')
-                                    data_offset += 1
-                    previous_index = total_items_index
+                    data_payload.append(data_item)
+                    total_pdu += item_sizes[index]
+                    batch.append(index)
             except Exception as exception:
-                item = item._replace(error=str(exception))
-                result[total_items_index] = item
+                result[index] = item._replace(error=str(exception))
+
+            # send once the next item would exceed the PDU or at the end of items list
+            # frame_header (up to item count) + current_pdu + next_item
+            if batch and (
+                index == last_index
+                or 19 + total_pdu + item_sizes[index + 1] >= pdu_length
+            ):
+                try:
+                    self._write_area_batch(
+                        request=request, 
+                        data_payload=data_payload, 
+                        batch=batch, 
+                        item_list=item_list, 
+                        result=result
+                    )
+                except Exception as exception:
+                    for batch_index in batch:
+                        result[batch_index] = item_list[batch_index]._replace(error=str(exception))
+                # keep the header, every patched field is rewritten before the next send
+                del request[19:]
+                data_payload.clear()
+                batch.clear()
+                total_pdu = 0
 
         return result
+
+
+    def _write_string(self, item:Tag) -> Tag:
+        """
+        Write a single STRING item, strings longer than 254 characters are truncated
+
+        Args:
+            item(Tag): string item to be written
+        Returns:
+            item(Tag): item with size and error
+        """
+
+        string_length = len(item.value)
+        string_value = item.value
+        if string_length > 254:
+            string_length = 254
+            string_value = string_value[:string_length]
+        item = item._replace(value=string_value, size=string_length)
+        response = self.write_area_raw(
+            address=item.address, 
+            raw_bytes=util.encode(item=item, endian=self.endian)
+        )
+        return item._replace(error=response[0].error)
+
+
+    def _write_area_batch(self, request:bytearray, data_payload:list, batch:list, item_list:list, result:list):
+        """
+        Send one write request and parse its reply into result
+
+        Args:
+            request(bytearray): telegram header followed by one spec per batch item
+            data_payload(list): data item headers and encoded values, in request order
+            batch(list): indexes into item_list, in request order
+            item_list(list): items passed to write_area
+            result(list): write_area result, updated in place
+        """
+
+        request[18] = len(batch)
+        header_param_length = 2 + (len(batch) * 12)
+        _U16.pack_into(request, 13, header_param_length)
+        header_data_length = sum(map(len, data_payload))
+        _U16.pack_into(request, 15, header_data_length)
+        _U16.pack_into(request, 2, 17 + header_param_length + header_data_length)
+        # data items follow the item specs straight from their own buffers
+        self._send(send_data=request, tail=data_payload)
+        data = self._recv()
+        # one return code per item
+        if (len(data) < 21 + len(batch)):
+            self.__log.error(f"self.write_area(): Invalid PDU size")
+            raise CommTypeError("Invalid PDU size")
+        # header error class and code
+        if data[17] != _CLASS_NO_ERROR or data[18] != 0:
+            self.__log.error(f"self.write_area(): Invalid PDU size")
+            raise CommTypeError("Invalid PDU size")
+
+        # one return code byte per item from index 0
+        return_codes = data[21:21 + len(batch)]
+        if return_codes == _ALL_SUCCESS[:len(batch)]:
+            # checked in one compare, only items carrying an old error change
+            batch = [index for index in batch if item_list[index].error]
+            return_codes = _ALL_SUCCESS
+        for index, data_return_code in zip(batch, return_codes):
+            if data_return_code != _RC_SUCCESS:
+                result[index] = item_list[index]._replace(error=_RETURN_CODE_TEXT[data_return_code])
+            elif item_list[index].error:
+                result[index] = item_list[index]._replace(error='')
+            # else result already holds the unchanged item
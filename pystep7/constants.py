@@ -284,7 +284,7 @@ class SubBlockType:
 
 # ISO Connection Request telegram (22 bytes)
 # Contains also ISO Header and COTP (Connection Oriented Transport Protocol) Header
-ISO_CR = [
+ISO_CR = bytes([
     # TPKT (RFC1006 Header)
     0x03, # RFC 1006 ID (3) 
     0x00, # Reserved, always 0
@@ -309,19 +309,19 @@ ISO_CR = [
     0x02, # Destination TSAP Length (2 bytes)
     0x01, # Destination TSAP HI (will be overwritten)
     0x02  # Destination TSAP LO (will be overwritten)
-]
+])
 
 # TPKT + ISO COTP Header (bytes)
-TPKT_ISO = [
+TPKT_ISO = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00,
     0x00, 0x1f,         # Telegram Length (Data Size + 31 or 35)
     # ISO COTP (ISO 8073 Header)
     0x02, 0xf0,0x80     # COTP (see above for info)
-]
+])
 
 # S7 PDU Negotiation Telegram (25 bytes)
-S7_PN = [
+S7_PN = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x19,                 # Telegram Length (Data Size + 31 or 35)
@@ -341,10 +341,10 @@ S7_PN = [
     0x00, 0x01,                 # Max AmQ: calling
     0x00, 0x01,                 # Max AmQ: called
     0x00, 0x1e                  # PDU Length Requested (Default 480 bytes)
-]
+])
 
 # S7 Read/Write Request Header (Read: 31 bytes, Write: 35 bytes)
-S7_READ_WRITE = [
+S7_READ_WRITE = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00,
     0x00, 0x1f,                 # Telegram Length (Data Size + 31 or 35)
@@ -373,10 +373,10 @@ S7_READ_WRITE = [
     0x00,                       # Reserved
     0x04,                       # Transport size
     0x00, 0x00                  # Data Length * 8 (if not bit or timer or counter)
-]
+])
 
 # S7 PLC time request (29 bytes)
-S7_GET_CLOCK = [
+S7_GET_CLOCK = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00,
     0x00, 0x1D,                 # Telegram Length (29)
@@ -401,10 +401,10 @@ S7_GET_CLOCK = [
     ReturnCode.OBJECT_NOT_EXIST,# Return code
     TransportSize.NULL,         # Transport size
     0x00, 0x00                  # Length
-]
+])
 
 # Set Date/Time command (39 bytes)
-S7_SET_CLOCK = [
+S7_SET_CLOCK = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x27,                 # Telegram Length (39)
@@ -438,10 +438,10 @@ S7_SET_CLOCK = [
     0x37,                       # Minute
     0x13,                       # Second
     0x00, 0x01                  # ms + Day of week   
-]
+])
 
 # SZL First telegram request (33 bytes)
-S7_SZL_FIRST = [
+S7_SZL_FIRST = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x21,                 # Telegram Length (33)
@@ -468,10 +468,10 @@ S7_SZL_FIRST = [
     0x00, 0x04,                 # Length
     0x00, 0x00,                 # SZL-ID ID (29)
     0x00, 0x00                  # SZL-Index Index (31)
-]
+])
 
 # SZL Next telegram request (33 bytes)
-S7_SZL_NEXT = [
+S7_SZL_NEXT = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x21,                 # Telegram Length (33)
@@ -499,10 +499,10 @@ S7_SZL_NEXT = [
     ReturnCode.OBJECT_NOT_EXIST,# Return code
     TransportSize.NULL,         # Transport size
     0x00, 0x00                  # Length
-]
+])
 
 # S7 STOP request (33 bytes)
-S7_STOP = [
+S7_STOP = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x21,                 # Telegram Length (33)
@@ -524,10 +524,10 @@ S7_STOP = [
     0x50, 0x5f, 0x50,           # "P_PROGRAM"
     0x52, 0x4f, 0x47,           # "P_PROGRAM"
     0x52, 0x41, 0x4d            # "P_PROGRAM"
-]
+])
 
 # S7 HOT Start request (37 bytes)
-S7_HOT_START = [
+S7_HOT_START = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x25,                 # Telegram Length (33)
@@ -551,10 +551,10 @@ S7_HOT_START = [
     0x50, 0x5f, 0x50,           # "P_PROGRAM"
     0x52, 0x4f, 0x47,           # "P_PROGRAM"
     0x52, 0x41, 0x4d            # "P_PROGRAM"
-]
+])
 
 # S7 COLD Start request (39 bytes)
-S7_COLD_START = [
+S7_COLD_START = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x27,                 # Telegram Length (35)
@@ -579,10 +579,10 @@ S7_COLD_START = [
     0x50, 0x5f, 0x50,           # "P_PROGRAM"
     0x52, 0x4f, 0x47,           # "P_PROGRAM"
     0x52, 0x41, 0x4d            # "P_PROGRAM"
-]
+])
 
 # S7 Get Block Info Request Header (37 bytes)
-S7_BLOCK_INFO = [
+S7_BLOCK_INFO = bytes([
     # TPKT (RFC1006 Header)
     0x03, 0x00, 
     0x00, 0x25,                 # Telegram Length (37)
@@ -610,7 +610,7 @@ S7_BLOCK_INFO = [
     0x30, 0x30, 0x30,           # ASCII block number
     0x30, 0x30,                 # ASCII block number
     0x41                        # Filesystem
-]
+])
 
 class Endian:
     native   = '='
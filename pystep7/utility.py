@@ -1,5 +1,8 @@
+import array
+import functools
 import re
 import struct
+import sys
 
 from datetime import date, datetime, timedelta
 from .constants import (
@@ -17,6 +20,37 @@ from .tag import (
 )
 
 
+# bytes on the wire per DataType (unknown types: 0)
+DATA_SIZE_BYTE = {
+    DataType.BIT:           1,  # S7 sends 1 byte per bit
+    DataType.BYTE:          1,
+    DataType.CHAR:          2,  # has terminating char
+    DataType.INT:           2,
+    DataType.WORD:          2,
+    DataType.DINT:          4,
+    DataType.DWORD:         4,
+    DataType.REAL:          4,
+    DataType.STRING:        256,
+    DataType.COUNTER:       1,
+    DataType.TIMER:         1,
+    DataType.S5TIME:        2,
+    DataType.DATE:          2,
+    DataType.TIME:          4,
+    DataType.TIME_OF_DAY:   4,
+    DataType.DATETIME:      8,
+    DataType.IECCOUNTER:    9,
+    DataType.IECTIMER:      22,
+}
+
+# fixed layouts per endian prefix, compiled once
+_ENDIANS = ('=', '<', '>', '!')
+_IEC_COUNTER_GET = {endian: struct.Struct(f'{endian}BBh?Bh?') for endian in _ENDIANS}
+_IEC_COUNTER_SET = {endian: struct.Struct(f'{endian}BBh?Bh?B') for endian in _ENDIANS}
+_IEC_TIMER = {endian: struct.Struct(f'{endian}?Bi?BiBBii') for endian in _ENDIANS}
+_TIME = {endian: struct.Struct(f'{endian}IH') for endian in _ENDIANS}
+_DATETIME = struct.Struct('BBBBBBBB')
+
+
 def calculate_write_item_size(item:Tag) -> int:
     """
     Calculate write item size
@@ -25,7 +59,7 @@ def calculate_write_item_size(item:Tag) -> int:
         item(Tag): item to be evaluated
     """
     total_size = 0
-    data_item_length = get_data_size_byte(item.type)
+    data_item_length = DATA_SIZE_BYTE.get(item.type, 0)
     # total_size += data_item_length
     if data_item_length < 2:
         data_item_length += 1
@@ -60,67 +94,10 @@ def decode(data:bytes, item_type:int, offset:int=0, endian:str='>'):
                             ">" (big: default) 
     """
 
-    encode = False
-    if item_type == DataType.BIT:
-        unpackFormat = "B"
-        encode = True
-    elif item_type == DataType.BYTE:
-        unpackFormat = "B"
-    elif item_type == DataType.CHAR:
-        unpackFormat = "1sB"
-    elif item_type == DataType.INT:
-        unpackFormat = "h"
-    elif item_type == DataType.WORD:
-        unpackFormat = "H"
-    elif item_type == DataType.DATE: # days since 1990-01-01
-        unpackFormat = "H"
-        encode = True
-    elif (
-        item_type == DataType.COUNTER
-        or item_type == DataType.TIMER
-    ): # 16b signed
-        unpackFormat = "h"
-        encode = True
-    elif item_type == DataType.DATETIME:
-        unpackFormat = "8s"
-        encode = True
-    elif item_type == DataType.S5TIME:
-        unpackFormat = "2s"
-        encode = True
-    elif item_type == DataType.DINT:
-        unpackFormat = "i"
-    elif item_type == DataType.REAL:
-        unpackFormat = "f"
-    elif (
-        item_type == DataType.DWORD
-        or item_type == DataType.TIME
-        or item_type == DataType.TIME_OF_DAY
-    ):
-        unpackFormat = "I"
-    elif item_type == DataType.IECCOUNTER:
-        unpackFormat = "9s"
-        encode = True
-    elif item_type == DataType.IECTIMER:
-        unpackFormat = "22s"
-        encode = True
-    value = struct.unpack_from(f'{endian}{unpackFormat}', data, offset)[0]
-    if encode:
-        if item_type == DataType.BIT:
-            value = True if value == 1 else False
-        if item_type == DataType.DATE:
-            value = get_date(DaysSince=value)
-        elif item_type == DataType.DATETIME:
-            value = get_datetime(buffer=value)
-        elif item_type == DataType.S5TIME:
-            value = get_s5_time(buffer=value)
-        elif item_type == DataType.COUNTER:
-            value = get_counter(Value=value)
-        elif item_type == DataType.TIMER:
-            value = get_timer(buffer=value)
-        elif item_type == DataType.IECCOUNTER:
-            value = get_iec_counter(buffer=value, endian=endian)
-        elif item_type == DataType.IECTIMER:
-            value = get_iec_timer(buffer=value, endian=endian)
+    unpacker, convert = get_decoder(item_type=item_type, endian=endian)
+    value = unpacker.unpack_from(data, offset)[0]
+    if convert is not None:
+        value = convert(value, endian)
     return value
 
 
@@ -136,48 +113,132 @@ def encode(item:Tag, endian:str='>') -> bytes:
         raw_bytes(bytes): encoded data as bytes
     """
 
-    if (item.type == DataType.BIT
-        or item.type == DataType.BYTE
-    ):
-        raw_bytes = struct.pack('BB', abs(int(item.value)&0xFF), 0x00)
-    elif item.type == DataType.CHAR:
-        raw_bytes = struct.pack('1sB', str(item.value).encode(), 0)
-    elif item.type == DataType.INT:
-        raw_bytes = struct.pack(f'{endian}h', int(item.value))
-    elif item.type == DataType.WORD:
-        raw_bytes = struct.pack(f'{endian}H', abs(item.value))
-    elif item.type == DataType.DINT:
-        raw_bytes = struct.pack(f'{endian}i', int(item.value))
-    elif (
-        item.type == DataType.DWORD
-        or item.type == DataType.TIME_OF_DAY
-        or item.type == DataType.TIME
-    ):
-        raw_bytes = struct.pack(f'{endian}I', abs(int(item.value)))
-    elif item.type == DataType.REAL:
-        raw_bytes = struct.pack(f'{endian}f', item.value)
-    elif item.type == DataType.STRING:
-        raw_bytes = struct.pack(
-            f'{endian}BB{len(item.value)}s', 
+    if item.type == DataType.STRING:
+        # single byte header fields, no byte order to apply
+        return bytes((
             0xFE,   # max string length 
-            len(item.value), 
-            item.value.encode()
-        )
-    elif item.type == DataType.DATE: # days since 1990-01-01
-        raw_bytes = struct.pack(f'{endian}H', set_date(item.value))
-    elif item.type == DataType.DATETIME:
-        raw_bytes = struct.pack('8s', set_datetime(item.value))
-    elif item.type == DataType.COUNTER:
-        raw_bytes = struct.pack(f'{endian}H', set_counter(Value=abs(int(item.value))))
-    elif item.type == DataType.TIMER:
-        raw_bytes = struct.pack(f'{endian}H', int(item.value))
-    elif item.type == DataType.S5TIME:
-        raw_bytes = struct.pack('2s', set_s5_time(item.value))
-    elif item.type == DataType.IECCOUNTER:
-        raw_bytes = struct.pack('10s', set_iec_counter(item.value))
-    elif item.type == DataType.IECTIMER:
-        raw_bytes = struct.pack('22s', set_iec_timer(item.value))
-    return raw_bytes
+            len(item.value)
+        )) + item.value.encode('latin-1')
+    packer, convert = _get_encoder(item_type=item.type, endian=endian)
+    return packer.pack(*convert(item.value))
+
+
+def decode_array(data:bytes, item_type:int, count:int, offset:int=0, endian:str='>') -> list:
+    """
+    Decode back to back values of the same type from raw bytes
+
+    Args:
+        data(bytes):    raw bytes buffer
+        item_type(int): item data type
+        count(int):     number of values
+        offset(int):    offset of the first value in the data buffer
+        endian(str):    data endian
+                            ">" (big: default)
+    Returns:
+        values(list): decoded values
+    """
+
+    typecode = _ARRAY_TYPECODES.get(item_type)
+    if typecode is not None:
+        # copy the values in one go and swap them in C when the byte order differs
+        values = array.array(typecode)
+        end = offset + count * values.itemsize
+        if end > len(data):
+            raise ValueError("Buffer too small")
+        values.frombytes(memoryview(data)[offset:end])
+        if _ARRAY_BYTESWAP[endian]:
+            values.byteswap()
+        return values.tolist()
+    unpackFormat, convert = _DECODE_FORMATS.get(item_type, ('', None))
+    if len(unpackFormat) != 1 or convert is not None:
+        size = DATA_SIZE_BYTE.get(item_type, 0)
+        return [
+            decode(data=data, item_type=item_type, offset=offset + i*size, endian=endian)
+            for i in range(count)
+        ]
+    return list(_get_array_struct(format=unpackFormat, count=count, endian=endian).unpack_from(data, offset))
+
+
+def encode_array(values:list, item_type:int, endian:str='>') -> bytes:
+    """
+    Encode values of the same type back to back into raw bytes
+
+    Args:
+        values(list):   values to be encoded
+        item_type(int): item data type, must be packed without padding
+                        (see is_array_type)
+        endian(str):    data endian
+                            ">" (big: default)
+    Returns:
+        raw_bytes(bytes): encoded data as bytes
+    """
+
+    if not is_array_type(item_type):
+        raise ValueError(f"Invalid data type {item_type}")
+    packFormat, convert = _ENCODE_FORMATS[item_type]
+    return _get_array_struct(format=packFormat, count=len(values), endian=endian).pack(
+        *[convert(value)[0] for value in values]
+    )
+
+
+def is_array_type(item_type:int) -> bool:
+    """
+    Check if items of a data type can be encoded back to back with encode_array
+
+    Args:
+        item_type(int): item data type
+    Returns:
+        result(bool): True when one value is encoded as exactly one field
+                        that fills the item size on the PLC
+    """
+    format = _ENCODE_FORMATS.get(item_type, ('',))[0]
+    # counters and timers pack as a word but only take one byte in data blocks
+    return len(format) == 1 and struct.calcsize(f'>{format}') == DATA_SIZE_BYTE.get(item_type, 0)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_array_struct(format:str, count:int, endian:str) -> struct.Struct:
+    return struct.Struct(f'{endian}{count}{format}')
+
+
+def get_decoder(item_type:int, endian:str) -> tuple:
+    """
+    Get compiled Struct and post conversion for a data type
+
+    Args:
+        item_type(int): item data type
+        endian(str):    data endian
+    Returns:
+        decoder(tuple): (Struct, convert(value, endian) or None)
+    """
+    decoder = _DECODERS.get((endian, item_type))
+    if decoder is None:
+        try:
+            unpackFormat, convert = _DECODE_FORMATS[item_type]
+        except KeyError:
+            raise ValueError(f"Invalid data type {item_type}")
+        decoder = _DECODERS[(endian, item_type)] = (struct.Struct(f'{endian}{unpackFormat}'), convert)
+    return decoder
+
+
+def _get_encoder(item_type:int, endian:str) -> tuple:
+    """
+    Get compiled Struct and pre conversion for a data type
+
+    Args:
+        item_type(int): item data type
+        endian(str):    data endian
+    Returns:
+        encoder(tuple): (Struct, convert(value) -> tuple of pack arguments)
+    """
+    encoder = _ENCODERS.get((endian, item_type))
+    if encoder is None:
+        try:
+            packFormat, convert = _ENCODE_FORMATS[item_type]
+        except KeyError:
+            raise ValueError(f"Invalid data type {item_type}")
+        encoder = _ENCODERS[(endian, item_type)] = (struct.Struct(f'{endian}{packFormat}'), convert)
+    return encoder
 
 
 def get_all_alpha(address:str) -> list:
@@ -190,10 +251,16 @@ def get_all_alpha(address:str) -> list:
         result(list): list of all alpha instances
             example: ['DB', 'DBX']
     """
+    return list(_parse_alpha(address))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_alpha(address:str) -> tuple:
+    # polling loops parse the same few addresses over and over
     alphas = re.findall(r"\D+", address.replace(".", ""))
     if len(alphas) < 1:
         raise ValueError("Invalid input")
-    return [alpha.strip().upper() for alpha in alphas]
+    return tuple(alpha.strip().upper() for alpha in alphas)
 
 
 def get_all_numeric(address:str) -> list:
@@ -207,6 +274,11 @@ def get_all_numeric(address:str) -> list:
             example: [21, 4, 1]
             exaple: [0, 1, 0] for "I 1.0" or "I1.0"
     """
+    return list(_parse_numeric(address))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_numeric(address:str) -> tuple:
     numbers = re.findall(r"\d+", address)
     if len(numbers) < 1:
         raise ValueError("Invalid input")
@@ -214,7 +286,28 @@ def get_all_numeric(address:str) -> list:
     # auto insert for non-DB areas
     while len(numbers) < 3:
         numbers.insert(0, 0)
-    return numbers
+    return tuple(numbers)
+
+
+def parse_address(address:str) -> tuple:
+    """
+    Parse an address into its area names, numbers and area code in one go
+
+    Args:
+        address(str): address (e.g. "DB 21.DBX 4.1" or "DB21.DBX4.1")
+    Returns:
+        (area_type(tuple), number_type(tuple), area(int)):
+            e.g. (('DB', 'DBX'), (21, 4, 1), Area.DB_DATABLOCKS)
+    Raises:
+        ValueError: address or area type is invalid
+    """
+    return _parse_address(address)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_address(address:str) -> tuple:
+    area_type = _parse_alpha(address)
+    return area_type, _parse_numeric(address), get_area_from_name(Name=area_type[0])
 
 
 def get_alpha(id:str) -> str:
@@ -245,25 +338,7 @@ def byte_to_nibbles(Value:int):
 
 
 def get_data_size_byte(DT:int) -> int:
-    if DT == DataType.BIT: return 1  # S7 sends 1 byte per bit
-    elif DT == DataType.BYTE: return 1
-    elif DT == DataType.CHAR: return 2 # has terminating char
-    elif DT == DataType.INT: return 2
-    elif DT == DataType.WORD: return 2
-    elif DT == DataType.DINT: return 4
-    elif DT == DataType.DWORD: return 4
-    elif DT == DataType.REAL: return 4
-    elif DT == DataType.STRING: return 256
-    elif DT == DataType.COUNTER: return 1
-    elif DT == DataType.TIMER: return 1
-    elif DT == DataType.S5TIME: return 2
-    elif DT == DataType.DATE: return 2
-    elif DT == DataType.TIME: return 4
-    elif DT == DataType.TIME_OF_DAY: return 4
-    elif DT == DataType.DATETIME: return 8
-    elif DT == DataType.IECCOUNTER: return 9
-    elif DT == DataType.IECTIMER: return 22
-    else: return 0
+    return DATA_SIZE_BYTE.get(DT, 0)
 
 
 def get_cpu_status(Status:int) -> str:
@@ -286,34 +361,44 @@ def get_startup_switch_selector(Value:int) -> str:
     else: return "Undefined"
 
 
+_BLOCK_LANGUAGES = {
+    0x01: "AWL",
+    0x02: "KOP",
+    0x03: "FUP",
+    0x04: "SCL",
+    0x05: "DB",
+    0x06: "GRAPH",
+    0x07: "SDB",
+    0x08: "CPU-DB",                     # DB was created from Plc programm (CREAT_DB)
+    0x11: "SDB (after overall reset)",  # another SDB, don't know what it means, in SDB 1 and SDB 2, uncertain
+    0x12: "SDB (Routing)",              # another SDB, in SDB 999 and SDB 1000 (routing information), uncertain
+    0x29: "Encrypt",                    # block is encrypted with S7-Block-Privacy
+}
+
+
 def get_block_language(Value:int) -> str:
-    if Value == 0x01: return "AWL"
-    elif Value == 0x02: return "KOP"
-    elif Value == 0x03: return "FUP"
-    elif Value == 0x04: return "SCL"
-    elif Value == 0x05: return "DB"
-    elif Value == 0x06: return "GRAPH"
-    elif Value == 0x07: return "SDB"
-    elif Value == 0x08: return "CPU-DB"                     # DB was created from Plc programm (CREAT_DB)
-    elif Value == 0x11: return "SDB (after overall reset)"  # another SDB, don't know what it means, in SDB 1 and SDB 2, uncertain
-    elif Value == 0x12: return "SDB (Routing)"              # another SDB, in SDB 999 and SDB 1000 (routing information), uncertain
-    elif Value == 0x29: return "Encrypt"                    # block is encrypted with S7-Block-Privacy
-    else: return "Undefined"
+    return _BLOCK_LANGUAGES.get(Value, "Undefined")
+
+
+_SUBBLOCK_TYPES = {
+    SubBlockType.OB: "OB",
+    SubBlockType.DB: "DB",
+    SubBlockType.SDB: "SDB",
+    SubBlockType.FC: "FC",
+    SubBlockType.SFC: "SFC",
+    SubBlockType.FB: "FB",
+    SubBlockType.SFB: "SFB",
+}
 
 
 def get_subblock_type(Value:int) -> str:
-    if Value == SubBlockType.OB: return "OB"
-    elif Value == SubBlockType.DB: return "DB"
-    elif Value == SubBlockType.SDB: return "SDB"
-    elif Value == SubBlockType.FC: return "FC"
-    elif Value == SubBlockType.SFC: return "SFC"
-    elif Value == SubBlockType.FB: return "FB"
-    elif Value == SubBlockType.SFB: return "SFB"
-    else: return "Undefined"
+    return _SUBBLOCK_TYPES.get(Value, "Undefined")
 
 
 def get_s5_time(buffer:bytes, offset:int=0) -> int:
-    multiplier, timeHi = byte_to_nibbles(buffer[offset+0])
+    value = buffer[offset+0]
+    multiplier = value >> 4
+    timeHi = value & 0x0F
     timeLo = bcd_to_byte(buffer[offset+1])
     return (10**multiplier)*(timeHi*1000 + timeLo*10)
 
@@ -327,10 +412,7 @@ def set_s5_time(Value:int) -> bytes:
         Value = Value // expo
         Value += 1000 * modLen
 
-    return struct.pack(
-        f'2s',
-        bytearray.fromhex(str(Value).rjust(4, '0'))
-    )
+    return bytes.fromhex(str(Value).rjust(4, '0'))
 
 
 def get_iec_counter(buffer:bytes, offset:int=0, endian:str=">") -> IecCounter:
@@ -342,7 +424,7 @@ def get_iec_counter(buffer:bytes, offset:int=0, endian:str=">") -> IecCounter:
         RESERVED2,
         CV,
         CDUO
-    ) = struct.unpack_from(f'{endian}BBh?Bh?', buffer, offset)
+    ) = _IEC_COUNTER_GET[endian].unpack_from(buffer, offset)
     C_DU = bool(CDU_LOADR & 1)
     LOAD_R = bool((CDU_LOADR >> 1) & 1)
     return IecCounter(
@@ -357,8 +439,7 @@ def get_iec_counter(buffer:bytes, offset:int=0, endian:str=">") -> IecCounter:
 
 def set_iec_counter(counter:IecCounter, endian:str=">") -> bytes:    
     CDU_LOADR = (int(counter.LOAD_R) << 1) + int(counter.C_DU)
-    return struct.pack(
-        f'{endian}BBh?Bh?B',
+    return _IEC_COUNTER_SET[endian].pack(
         CDU_LOADR,
         0x00, # RESERVED
         counter.PV,
@@ -382,7 +463,7 @@ def get_iec_timer(buffer:bytes, offset:int=0, endian:str=">") -> IecTimer:
         RESERVED3,
         STIME,
         ATIME
-    ) = struct.unpack_from(f'{endian}?Bi?BiBBii', buffer, offset)
+    ) = _IEC_TIMER[endian].unpack_from(buffer, offset)
     return IecTimer(
         IN=IN,
         PT=PT,
@@ -395,8 +476,7 @@ def get_iec_timer(buffer:bytes, offset:int=0, endian:str=">") -> IecTimer:
 
 
 def set_iec_timer(timer:IecTimer, endian:str=">") -> bytes:
-    return struct.pack(
-        f'{endian}?Bi?BiBBii',
+    return _IEC_TIMER[endian].pack(
         timer.IN,
         0x00, # RESERVED
         timer.PT,
@@ -440,7 +520,7 @@ def set_time(DT:datetime, endian:str='>') -> bytes:
     milliseconds = DT.microsecond // 1000
     days = diff.days
 
-    return struct.pack(f'{endian}IH', milliseconds, days)
+    return _TIME[endian].pack(milliseconds, days)
 
 
 def get_date(DaysSince:int=0) -> date:
@@ -485,8 +565,7 @@ def set_datetime(DT:datetime) -> bytes:
     # MSecL = Last digit of miliseconds
     MsecL = (millisecond % 10) * 10 + dow
 
-    return struct.pack(
-        'BBBBBBBB',
+    return _DATETIME.pack(
         byte_to_bcd(year),
         byte_to_bcd(DT.month),
         byte_to_bcd(DT.day),
@@ -514,458 +593,532 @@ def get_area_from_name(Name:str) -> int:
     else: raise ValueError(f"Invalid area type {Name}")
 
 
+# diagnostic event ID -> description
+_CPU_DIAGNOSTICS = {
+    0x113A: "Start request for cyclic interrupt OB with special handling (S7-300 only)",
+    0x1155: "Status alarm for PROFIBUS DP",
+    0x1156: "Update interrupt for PROFIBUS DP",
+    0x1157: "Manufacturer interrupt for PROFIBUS DP",
+    0x1158: "Status interrupt for PROFINET IO",
+    0x1159: "Update interrupt for PROFINET IO",
+    0x115A: "Manufacturer interrupt for PROFINET IO",
+    0x115B: "IO: Profile-specific interrupt",
+    0x116A: "Technology synchronization interrupt",
+    0x1381: "Request for manual warm restart",
+    0x1382: "Request for automatic warm restart",
+    0x1383: "Request for manual hot restart",
+    0x1384: "Request for automatic hot restart",
+    0x1385: "Request for manual cold restart",
+    0x1386: "Request for automatic cold restart",
+    0x1387: "Master CPU: request for manual cold restart",
+    0x1388: "Master CPU: request for automatic cold restart",
+    0x138A: "Master CPU: request for manual warm restart",
+    0x138B: "Master CPU: request for automatic warm restart",
+    0x138C: "Standby CPU: request for manual hot restart",
+    0x138D: "Standby CPU: request for automatic hot restart",
+    0x2521: "BCD conversion error",
+    0x2522: "Area length error when reading",
+    0x2523: "Area length error when writing",
+    0x2524: "Area error when reading",
+    0x2525: "Area error when writing",
+    0x2526: "Timer number error",
+    0x2527: "Counter number error",
+    0x2528: "Alignment error when reading",
+    0x2529: "Alignment error when writing",
+    0x2530: "Write error when accessing the DB",
+    0x2531: "Write error when accessing the DI",
+    0x2532: "Block number error when opening a DB",
+    0x2533: "Block number error when opening a DI",
+    0x2534: "Block number error when calling an FC",
+    0x2535: "Block number error when calling an FB",
+    0x253A: "DB not loaded",
+    0x253C: "FC not loaded",
+    0x253D: "SFC not loaded",
+    0x253E: "FB not loaded",
+    0x253F: "SFB not loaded",
+    0x2942: "I/O access error, reading",
+    0x2943: "I/O access error, writing",
+    0x3267: "End of module reconfiguration",
+    0x3367: "Start of module reconfiguration",
+    0x34A4: "PROFInet Interface DB can be addressed again",
+    0x3501: "Cycle time exceeded",
+    0x3502: "User interface (OB or FRB) request error",
+    0x3503: "Delay too long processing a priority class",
+    0x3505: "Time-of-day interrupt(s) skipped due to new clock setting",
+    0x3506: "Time-of-day interrupt(s) skipped when changing to RUN after HOLD",
+    0x3507: "Multiple OB request errors caused internal buffer overflow",
+    0x3508: "Synchronous cycle interrupt-timing error",
+    0x3509: "Interrupt loss due to excess interrupt load",
+    0x350A: "Resume RUN mode after CiR",
+    0x350B: "Technology synchronization interrupt - timing error",
+    0x3571: "Nesting depth too high in nesting levels",
+    0x3572: "Nesting depth for Master Control Relays too high",
+    0x3573: "Nesting depth too high after synchronous errors",
+    0x3574: "Nesting depth for block calls (U stack) too high",
+    0x3575: "Nesting depth for block calls (B stack) too high",
+    0x3576: "Local data allocation error",
+    0x3578: "Unknown instruction",
+    0x357A: "Jump instruction to target outside of the block",
+    0x3582: "Memory error detected and corrected by operating system",
+    0x3583: "Accumulation of detected and corrected memo errors",
+    0x3585: "Error in the PC operating system (only for LC RTX)",
+    0x3587: "Multi-bit memory error detected and corrected",
+    0x35A1: "User interface (OB or FRB) not found",
+    0x35A2: "OB not loaded (started by SFC or operating system due to configuration)",
+    0x35A3: "Error when operating system accesses a block",
+    0x35A4: "PROFInet Interface DB cannot be addressed",
+    0x35D2: "Diagnostic entries cannot be sent at present",
+    0x35D3: "Synchronization frames cannot be sent",
+    0x35D4: "Illegal time jump resulting from synchronization",
+    0x35D5: "Error adopting the synchronization time",
+    0x35E1: "Incorrect frame ID in GD",
+    0x35E2: "GD packet status cannot be entered in DB",
+    0x35E3: "Frame length error in GD",
+    0x35E4: "Illegal GD packet number received",
+    0x35E5: "Error accessing DB in communication SFBs for configured S7 connections",
+    0x35E6: "GD total status cannot be entered in DB",
+    0x3821: "BATTF: failure on at least one backup battery of the central rack, problem eliminated",
+    0x3822: "BAF: failure of backup voltage on central rack, problem eliminated",
+    0x3823: "24 volt supply failure on central rack, problem eliminated",
+    0x3825: "BATTF: failure on at least one backup battery of the redundant central rack, problem eliminated",
+    0x3826: "BAF: failure of backup voltage on redundant central rack, problem eliminated",
+    0x3827: "24 volt supply failure on redundant central rack, problem eliminated",
+    0x3831: "BATTF: failure of at least one backup battery of the expansion rack, problem eliminated",
+    0x3832: "BAF: failure of backup voltage on expansion rack, problem eliminated",
+    0x3833: "24 volt supply failure on at least one expansion rack, problem eliminated",
+    0x3842: "Module OK",
+    0x3854: "PROFINET IO interface submodule/submodule and matches the configured interface submodule/submodule",
+    0x3855: "PROFINET IO interface submodule/submodule inserted, but does not match the configured interface submodule/submodule",
+    0x3856: "PROFINET IO interface submodule/submodule inserted, but error in module parameter assignment",
+    0x3858: "PROFINET IO interface submodule access error corrected",
+    0x3861: "Module/interface module inserted, module type OK",
+    0x3863: "Module/interface module plugged in, but wrong module type",
+    0x3864: "Module/interface module plugged in, but causing problem (type ID unreadable)",
+    0x3865: "Module plugged in, but error in module parameter assignment",
+    0x3866: "Module can be addressed again, load voltage error removed",
+    0x3881: "Interface error leaving state",
+    0x3884: "Interface module plugged in",
+    0x38B3: "I/O access error when updating the process image input table",
+    0x38B4: "I/O access error when transferring the process image to the output modules",
+    0x38C1: "Expansion rack operational again (1 to 21), leaving state",
+    0x38C2: "Expansion rack operational again but mismatch between setpoint and actual configuration",
+    0x38C4: "Distributed I/Os: station failure, leaving state",
+    0x38C5: "Distributed I/Os: station fault, leaving state",
+    0x38C6: "Expansion rack operational again, but error(s) in module parameter assignment",
+    0x38C7: "DP: station operational again, but error(s) in module parameter assignment",
+    0x38C8: "DP: station operational again, but mismatch between setpoint and actual configuration",
+    0x38CB: "PROFINET IO station operational again",
+    0x38CC: "PROFINET IO station error corrected",
+    0x3921: "BATTF: failure on at least one backup battery of the central rack",
+    0x3922: "BAF: failure of backup voltage on central rack",
+    0x3923: "24 volt supply failure on central rack",
+    0x3925: "BATTF: failure on at least one backup battery of the redundant central rack",
+    0x3926: "BAF: failure of backup voltage on redundant central rack",
+    0x3927: "24 volt supply failure on redundant central rack",
+    0x3931: "BATTF: failure of at least one backup battery of the expansion rack",
+    0x3932: "BAF: failure of backup voltage on expansion rack",
+    0x3933: "24 volt supply failure on at least one expansion rack",
+    0x3942: "Module error",
+    0x3951: "PROFINET IO submodule removed",
+    0x3954: "PROFINET IO interface submodule/submodule removed",
+    0x3961: "Module/interface module removed, cannot be addressed",
+    0x3966: "Module cannot be addressed, load voltage error",
+    0x3968: "Module reconfiguration has ended with error",
+    0x3981: "Interface error entering state",
+    0x3984: "Interface module removed",
+    0x3986: "Performance of an H-Sync link negatively affected",
+    0x39B1: "I/O access error when updating the process image input table",
+    0x39B2: "I/O access error when transferring the process image to the output modules",
+    0x39B3: "I/O access error when updating the process image input table",
+    0x39B4: "I/O access error when transferring the process image to the output modules",
+    0x39C1: "Expansion rack failure (1 to 21), entering state",
+    0x39C3: "Distributed I/Os: master system failure entering state",
+    0x39C4: "Distributed I/Os: station failure, entering state",
+    0x39C5: "Distributed I/Os: station fault, entering state",
+    0x39CA: "PROFINET IO system failure",
+    0x39CB: "PROFINET IO station failure",
+    0x39CC: "PROFINET IO station error",
+    0x39CD: "PROFINET IO station operational again, but expected configuration does not match actual configuration",
+    0x39CE: "PROFINET IO station operational again, but error(s) in module parameter assignment",
+    0x42F3: "Checksum error detected and corrected by the operating system",
+    0x42F4: "Standby CPU: connection/update via SFC90 is locked in the master CPU",
+    0x4300: "Backed-up power on",
+    0x4301: "Mode transition from STOP to STARTUP",
+    0x4302: "Mode transition from STARTUP to RUN",
+    0x4303: "STOP caused by stop switch being activated",
+    0x4304: "STOP caused by PG STOP operation or by SFB 20 STOP",
+    0x4305: "HOLD: breakpoint reached",
+    0x4306: "HOLD: breakpoint exited",
+    0x4307: "Memory reset started by PG operation",
+    0x4308: "Memory reset started by switch setting",
+    0x4309: "Memory reset started automatically (power on not backed up)",
+    0x430A: "HOLD exited, transition to STOP",
+    0x430D: "STOP caused by other CPU in multicomputing",
+    0x430E: "Memory reset executed",
+    0x430F: "STOP on the module due to STOP on a CPU",
+    0x4318: "Start of CiR",
+    0x4319: "CiR completed",
+    0x4357: "Module watchdog started",
+    0x4358: "All modules are ready for operation",
+    0x43B0: "Firmware update was successful",
+    0x43B4: "Error in firmware fuse",
+    0x43B6: "Firmware updates canceled by redundant modules",
+    0x43D3: "STOP on standby CPU",
+    0x43DC: "Abort during link-up with switchover",
+    0x43DE: "Updating aborted due to monitoring time being exceeded during the n-th attempt, new update attempt initiated",
+    0x43DF: "Updating aborted for final time due to monitoring time being exceeded after completing the maximum amount of attempts. User intervention required",
+    0x43E0: "Change from solo mode after link-up",
+    0x43E1: "Change from link-up after updating",
+    0x43E2: "Change from updating to redundant mode",
+    0x43E3: "Master CPU: change from redundant mode to solo mode",
+    0x43E4: "Standby CPU: change from redundant mode after error-search mode",
+    0x43E5: "Standby CPU: change from error-search mode after link-up or STOP",
+    0x43E6: "Link-up aborted on the standby CPU",
+    0x43E7: "Updating aborted on the standby CPU",
+    0x43E8: "Standby CPU: change from link-up after startup",
+    0x43E9: "Standby CPU: change from startup after updating",
+    0x43F1: "Reserve-master switchover",
+    0x43F2: "Coupling of incompatible H-CPUs blocked by system program",
+    0x4510: "STOP violation of the CPU's data range",
+    0x4520: "DEFECTIVE: STOP not possible",
+    0x4521: "DEFECTIVE: failure of instruction processing processor",
+    0x4522: "DEFECTIVE: failure of clock chip",
+    0x4523: "DEFECTIVE: failure of clock pulse generator",
+    0x4524: "DEFECTIVE: failure of timer update function",
+    0x4525: "DEFECTIVE: failure of multicomputing synchronization",
+    0x4527: "DEFECTIVE: failure of I/O access monitoring",
+    0x4528: "DEFECTIVE: failure of scan time monitoring",
+    0x4530: "DEFECTIVE: memory test error in internal memory",
+    0x4532: "DEFECTIVE: failure of core resources",
+    0x4536: "DEFECTIVE: switch defective",
+    0x4540: "STOP: Memory expansion of the internal work memory has gaps. First memory expansion too small or missing",
+    0x4541: "STOP caused by priority class system",
+    0x4542: "STOP caused by object management system",
+    0x4543: "STOP caused by test functions",
+    0x4544: "STOP caused by diagnostic system",
+    0x4545: "STOP caused by communication system",
+    0x4546: "STOP caused by CPU memory management",
+    0x4547: "STOP caused by process image management",
+    0x4548: "STOP caused by I/O management",
+    0x454A: "STOP caused by configuration: an OB deselected with STEP 7 was being loaded into the CPU during STARTUP",
+    0x4550: "DEFECTIVE: internal system error",
+    0x4555: "No restart possible, monitoring time elapsed",
+    0x4556: "STOP: memory reset request from communication system / due to data inconsistency",
+    0x4562: "STOP caused by programming error (OB not loaded or not possible)",
+    0x4563: "STOP caused by I/O access error (OB not loaded or not possible)",
+    0x4567: "STOP caused by H event",
+    0x4568: "STOP caused by time error (OB not loaded or not possible)",
+    0x456A: "STOP caused by diagnostic interrupt (OB not loaded or not possible)",
+    0x456B: "STOP caused by removing/inserting module (OB not loaded or not possible)",
+    0x456C: "STOP caused by CPU hardware error (OB not loaded or not possible, or no FRB)",
+    0x456D: "STOP caused by program sequence error (OB not loaded or not possible)",
+    0x456E: "STOP caused by communication error (OB not loaded or not possible)",
+    0x456F: "STOP caused by rack failure OB (OB not loaded or not possible)",
+    0x4570: "STOP caused by process interrupt (OB not loaded or not possible)",
+    0x4571: "STOP caused by nesting stack error",
+    0x4572: "STOP caused by master control relay stack error",
+    0x4573: "STOP caused by exceeding the nesting depth for synchronous errors",
+    0x4574: "STOP caused by exceeding interrupt stack nesting depth in the priority class stack",
+    0x4575: "STOP caused by exceeding block stack nesting depth in the priority class stack",
+    0x4576: "STOP caused by error when allocating the local data",
+    0x4578: "STOP caused by unknown opcode",
+    0x457A: "STOP caused by code length error",
+    0x457B: "STOP caused by DB not being loaded on on-board I/Os",
+    0x457D: "Reset/clear request because the version of the internal interface to the integrated technology was changed",
+    0x457F: "STOP caused by STOP command",
+    0x4580: "STOP: back-up buffer contents inconsistent (no transition to RUN)",
+    0x4590: "STOP caused by overloading the internal functions",
+    0x45D5: "LINK-UP rejected due to mismatched CPU memory configuration of the sub-PLC",
+    0x45D6: "LINK-UP rejected due to mismatched system program of the sub-PLC",
+    0x45D8: "DEFECTIVE: hardware fault detected due to other error",
+    0x45D9: "STOP due to SYNC module error",
+    0x45DA: "STOP due to synchronization error between H CPUs",
+    0x45DD: "LINK-UP rejected due to running test or other online functions",
+    0x4926: "DEFECTIVE: failure of the watchdog for I/O access",
+    0x4931: "STOP or DEFECTIVE: memory test error in memory submodule",
+    0x4933: "Checksum error",
+    0x4934: "DEFECTIVE: memory not available",
+    0x4935: "DEFECTIVE: cancelled by watchdog/processor exceptions",
+    0x4949: "STOP caused by continuous hardware interrupt",
+    0x494D: "STOP caused by I/O error",
+    0x494E: "STOP caused by power failure",
+    0x494F: "STOP caused by configuration error",
+    0x4959: "One or more modules not ready for operation",
+    0x497C: "STOP caused by integrated technology",
+    0x49A0: "STOP caused by parameter assignment error or non-permissible variation of setpoint and actual extension: Start-up blocked",
+    0x49A1: "STOP caused by parameter assignment error: memory reset request",
+    0x49A2: "STOP caused by error in parameter modification: startup disabled",
+    0x49A3: "STOP caused by error in parameter modification: memory reset request",
+    0x49A4: "STOP: inconsistency in configuration data",
+    0x49A5: "STOP: distributed I/Os: inconsistency in the loaded configuration information",
+    0x49A6: "STOP: distributed I/Os: invalid configuration information",
+    0x49A7: "STOP: distributed I/Os: no configuration information",
+    0x49A8: "STOP: error indicated by the interface module for the distributed I/Os",
+    0x49B1: "Firmware update data incorrect",
+    0x49B2: "Firmware update: hardware version does not match firmware",
+    0x49B3: "Firmware update: module type does not match firmware",
+    0x49D0: "LINK-UP aborted due to violation of coordination rules",
+    0x49D1: "LINK-UP/UPDATE sequence aborted",
+    0x49D2: "Standby CPU changed to STOP due to STOP on the master CPU during link-up",
+    0x49D4: "STOP on a master, since partner CPU is also a master (link-up error)",
+    0x49D7: "LINK-UP rejected due to change in user program or in configuration",
+    0x510F: "A problem as occurred with WinLC. This problem has caused the CPU to go into STOP mode or has caused a fault in the CPU",
+    0x530D: "New startup information in the STOP mode",
+    0x5311: "Startup despite Not Ready message from module(s)",
+    0x5371: "Distributed I/Os: end of the synchronization with a DP master",
+    0x5380: "Diagnostic buffer entries of interrupt and asynchronous errors disabled",
+    0x5395: "Distributed I/Os: reset of a DP master",
+    0x53A2: "Download of technology firmware successful",
+    0x53A4: "Download of technology DB not successful",
+    0x53FF: "Reset to factory setting",
+    0x5445: "Start of System reconfiguration in RUN mode",
+    0x5481: "All licenses for runtime software are complete again",
+    0x5498: "No more inconsistency with DP master systems due to CiR",
+    0x5545: "Start of System reconfiguration in RUN mode",
+    0x5581: "One or several licenses for runtime software are missing",
+    0x558A: "Difference between the MLFB of the configured and inserted CPU",
+    0x558B: "Difference in the firmware version of the configured and inserted CPU",
+    0x5598: "Start of possible inconsistency with DP master systems due to CiR",
+    0x55A5: "Version conflict: internal interface with integrated technology",
+    0x55A6: "The maximum number of technology objects has been exceeded",
+    0x55A7: "A technology DB of this type is already present",
+    0x5879: "Diagnostic message from DP interface: EXTF LED off",
+    0x5960: "Parameter assignment error when switching",
+    0x5961: "Parameter assignment error",
+    0x5962: "Parameter assignment error preventing startup",
+    0x5963: "Parameter assignment error with memory reset request",
+    0x5966: "Parameter assignment error when switching",
+    0x5969: "Parameter assignment error with startup blocked",
+    0x596A: "PROFINET IO: IP address of an IO device already present",
+    0x596B: "IP address of an Ethernet interface already exists",
+    0x596C: "Name of an Ethernet interface already exists",
+    0x596D: "The existing network configuration does not mach the system requirements or configuration",
+    0x5979: "Diagnostic message from DP interface: EXTF LED on",
+    0x597C: "DP Global Control command failed or moved",
+    0x59A0: "The interrupt can not be associated in the CPU",
+    0x59A1: "Configuration error in the integrated technology",
+    0x59A3: "Error when downloading the integrated technology",
+    0x6253: "Firmware update: End of firmware download over the network",
+    0x6316: "Interface error when starting programmable controller",
+    0x6353: "Firmware update: Start of firmware download over the network",
+    0x6390: "Formatting of Micro Memory Card complete",
+    0x6500: "Connection ID exists twice on module",
+    0x6501: "Connection resources inadequate",
+    0x6502: "Error in the connection description",
+    0x6510: "CFB structure error detected in instance DB when evaluating EPROM",
+    0x6514: "GD packet number exists twice on the module",
+    0x6515: "Inconsistent length specifications in GD configuration information",
+    0x6521: "No memory submodule and no internal memory available",
+    0x6522: "Illegal memory submodule: replace submodule and reset memory",
+    0x6523: "Memory reset request due to error accessing submodule",
+    0x6524: "Memory reset request due to error in block header",
+    0x6526: "Memory reset request due to memory replacement",
+    0x6527: "Memory replaced, therefore restart not possible",
+    0x6528: "Object handling function in the STOP/HOLD mode, no restart possible",
+    0x6529: "No startup possible during the \"load user program\" function",
+    0x652A: "No startup because block exists twice in user memory",
+    0x652B: "No startup because block is too long for submodule - replace submodule",
+    0x652C: "No startup due to illegal OB on submodule",
+    0x6532: "No startup because illegal configuration information on submodule",
+    0x6533: "Memory reset request because of invalid submodule content",
+    0x6534: "No startup: block exists more than once on submodule",
+    0x6535: "No startup: not enough memory to transfer block from submodule",
+    0x6536: "No startup: submodule contains an illegal block number",
+    0x6537: "No startup: submodule contains a block with an illegal length",
+    0x6538: "Local data or write-protection ID (for DB) of a block illegal for CPU",
+    0x6539: "Illegal command in block (detected by compiler)",
+    0x653A: "Memory reset request because local OB data on submodule too short",
+    0x6543: "No startup: illegal block type",
+    0x6544: "No startup: attribute \"relevant for processing\" illegal",
+    0x6545: "Source language illegal",
+    0x6546: "Maximum amount of configuration information reached",
+    0x6547: "Parameter assignment error assigning parameters to modules (not on P bus, cancel download)",
+    0x6548: "Plausibility error during block check",
+    0x6549: "Structure error in block",
+    0x6550: "A block has an error in the CRC",
+    0x6551: "A block has no CRC",
+    0x6560: "SCAN overflow",
+    0x6805: "Resource problem on configured connections, eliminated",
+    0x6881: "Interface error leaving state",
+    0x6905: "Resource problem on configured connections",
+    0x6981: "Interface error entering state",
+    0x72A2: "Failure of a DP master or a DP master system",
+    0x72A3: "Redundancy restored on the DP slave",
+    0x72DB: "Safety program: safety mode disabled",
+    0x72E0: "Loss of redundancy in communication, problem eliminated",
+    0x7301: "Loss of redundancy (1 of 2) due to failure of a CPU",
+    0x7302: "Loss of redundancy (1 of 2) due to STOP on the standby triggered by user",
+    0x7303: "H system (1 of 2) changed to redundant mode",
+    0x7323: "Discrepancy found in operating system data",
+    0x7331: "Standby-master switchover due to master failure",
+    0x7333: "Standby-master switchover due to system modification during runtime",
+    0x7334: "Standby-master switchover due to communication error at the synchronization module",
+    0x7340: "Synchronization error in user program due to elapsed wait time",
+    0x7341: "Synchronization error in user program due to waiting at different synchronization points",
+    0x7342: "Synchronization error in operating system due to waiting at different synchronization points",
+    0x7343: "Synchronization error in operating system due to elapsed wait time",
+    0x7344: "Synchronization error in operating system due to incorrect data",
+    0x734A: "The \"Re-enable\" job triggered by SFC 90 \"H_CTRL\" was executed",
+    0x73A3: "Loss of redundancy on the DP slave",
+    0x73C1: "Update process canceled",
+    0x73C2: "Updating aborted due to monitoring time being exceeded during the n-th attempt (1 = n = max. possible number of update attempts after abort due to excessive monitoring time)",
+    0x73D8: "Safety mode disabled",
+    0x73DB: "Safety program: safety mode enabled",
+    0x73E0: "Loss of redundancy in communication",
+    0x74DD: "Safety program: Shutdown of a fail-save runtime group disabled",
+    0x74DE: "Safety program: Shutdown of the F program disabled",
+    0x74DF: "Start of F program initialization",
+    0x7520: "Error in RAM comparison",
+    0x7521: "Error in comparison of process image output value",
+    0x7522: "Error in comparison of memory bits, timers, or counters",
+    0x75D1: "Safety program: Internal CPU error",
+    0x75D2: "Safety program error: Cycle time time-out",
+    0x75D6: "Data corrupted in safety program prior to the output to F I/O",
+    0x75D7: "Data corrupted in safety program prior to the output to partner F-CPU",
+    0x75D9: "Invalid REAL number in a DB",
+    0x75DA: "Safety program: Error in safety data format",
+    0x75DC: "Runtime group, internal protocol error",
+    0x75DD: "Safety program: Shutdown of a fail-save runtime group enabled",
+    0x75DE: "Safety program: Shutdown of the F program enabled",
+    0x75DF: "End of F program initialization",
+    0x75E1: "Safety program: Error in FB \"F_PLK\" or \"F_PLK_O\" or \"F_CYC_CO\" or \"F_TEST\" or \"F_TESTC\"",
+    0x75E2: "Safety program: Area length error",
+    0x7852: "SYNC module inserted",
+    0x7855: "SYNC module eliminated",
+    0x78D3: "Communication error between PROFIsafe and F I/O",
+    0x78D4: "Error in safety relevant communication between F CPUs",
+    0x78D5: "Error in safety relevant communication between F CPUs",
+    0x78E3: "F-I/O device input channel depassivated",
+    0x78E4: "F-I/O device output channel depassivated",
+    0x78E5: "F-I/O device depassivated",
+    0x7934: "Standby-master switchover due to connection problem at the SYNC module",
+    0x7950: "Synchronization module missing",
+    0x7951: "Change at the SYNC module without Power On",
+    0x7952: "SYNC module removed",
+    0x7953: "Change at the SYNC-module without reset",
+    0x7954: "SYNC module: rack number assigned twice",
+    0x7955: "SYNC module error",
+    0x7956: "Illegal rack number set on SYNC module",
+    0x7960: "Redundant I/O: Time-out of discrepancy time at digital input, error is not yet localized",
+    0x7961: "Redundant I/O, digital input error: Signal change after expiration of the discrepancy time",
+    0x7962: "Redundant I/O: Digital input error",
+    0x796F: "Redundant I/O: The I/O was globally disabled",
+    0x7970: "Redundant I/O: Digital output error",
+    0x7980: "Redundant I/O: Time-out of discrepancy time at analog input",
+    0x7981: "Redundant I/O: Analog input error",
+    0x7990: "Redundant I/O: Analog output error",
+    0x79D3: "Communication error between PROFIsafe and F I/O",
+    0x79D4: "Error in safety relevant communication between F CPUs",
+    0x79D5: "Error in safety relevant communication between F CPUs",
+    0x79E3: "F-I/O device input channel passivated",
+    0x79E4: "F-I/O device output channel passivated",
+    0x79E5: "F-I/O device passivated",
+    0x79E6: "Inconsistent safety program",
+    0x79E7: "Simulation block (F system block) loaded",
+}
+
+
 def get_cpu_diagnostic(Value:int) -> str:
-    if Value == 0x113A: return "Start request for cyclic interrupt OB with special handling (S7-300 only)"
-    elif Value == 0x1155: return "Status alarm for PROFIBUS DP"
-    elif Value == 0x1156: return "Update interrupt for PROFIBUS DP"
-    elif Value == 0x1157: return "Manufacturer interrupt for PROFIBUS DP"
-    elif Value == 0x1158: return "Status interrupt for PROFINET IO"
-    elif Value == 0x1159: return "Update interrupt for PROFINET IO"
-    elif Value == 0x115A: return "Manufacturer interrupt for PROFINET IO"
-    elif Value == 0x115B: return "IO: Profile-specific interrupt"
-    elif Value == 0x116A: return "Technology synchronization interrupt"
-    elif Value == 0x1381: return "Request for manual warm restart"
-    elif Value == 0x1382: return "Request for automatic warm restart"
-    elif Value == 0x1383: return "Request for manual hot restart"
-    elif Value == 0x1384: return "Request for automatic hot restart"
-    elif Value == 0x1385: return "Request for manual cold restart"
-    elif Value == 0x1386: return "Request for automatic cold restart"
-    elif Value == 0x1387: return "Master CPU: request for manual cold restart"
-    elif Value == 0x1388: return "Master CPU: request for automatic cold restart"
-    elif Value == 0x138A: return "Master CPU: request for manual warm restart"
-    elif Value == 0x138B: return "Master CPU: request for automatic warm restart"
-    elif Value == 0x138C: return "Standby CPU: request for manual hot restart"
-    elif Value == 0x138D: return "Standby CPU: request for automatic hot restart"
-    elif Value == 0x2521: return "BCD conversion error"
-    elif Value == 0x2522: return "Area length error when reading"
-    elif Value == 0x2523: return "Area length error when writing"
-    elif Value == 0x2524: return "Area error when reading"
-    elif Value == 0x2525: return "Area error when writing"
-    elif Value == 0x2526: return "Timer number error"
-    elif Value == 0x2527: return "Counter number error"
-    elif Value == 0x2528: return "Alignment error when reading"
-    elif Value == 0x2529: return "Alignment error when writing"
-    elif Value == 0x2530: return "Write error when accessing the DB"
-    elif Value == 0x2531: return "Write error when accessing the DI"
-    elif Value == 0x2532: return "Block number error when opening a DB"
-    elif Value == 0x2533: return "Block number error when opening a DI"
-    elif Value == 0x2534: return "Block number error when calling an FC"
-    elif Value == 0x2535: return "Block number error when calling an FB"
-    elif Value == 0x253A: return "DB not loaded"
-    elif Value == 0x253C: return "FC not loaded"
-    elif Value == 0x253D: return "SFC not loaded"
-    elif Value == 0x253E: return "FB not loaded"
-    elif Value == 0x253F: return "SFB not loaded"
-    elif Value == 0x2942: return "I/O access error, reading"
-    elif Value == 0x2943: return "I/O access error, writing"
-    elif Value == 0x3267: return "End of module reconfiguration"
-    elif Value == 0x3367: return "Start of module reconfiguration"
-    elif Value == 0x34A4: return "PROFInet Interface DB can be addressed again"
-    elif Value == 0x3501: return "Cycle time exceeded"
-    elif Value == 0x3502: return "User interface (OB or FRB) request error"
-    elif Value == 0x3503: return "Delay too long processing a priority class"
-    elif Value == 0x3505: return "Time-of-day interrupt(s) skipped due to new clock setting"
-    elif Value == 0x3506: return "Time-of-day interrupt(s) skipped when changing to RUN after HOLD"
-    elif Value == 0x3507: return "Multiple OB request errors caused internal buffer overflow"
-    elif Value == 0x3508: return "Synchronous cycle interrupt-timing error"
-    elif Value == 0x3509: return "Interrupt loss due to excess interrupt load"
-    elif Value == 0x350A: return "Resume RUN mode after CiR"
-    elif Value == 0x350B: return "Technology synchronization interrupt - timing error"
-    elif Value == 0x3571: return "Nesting depth too high in nesting levels"
-    elif Value == 0x3572: return "Nesting depth for Master Control Relays too high"
-    elif Value == 0x3573: return "Nesting depth too high after synchronous errors"
-    elif Value == 0x3574: return "Nesting depth for block calls (U stack) too high"
-    elif Value == 0x3575: return "Nesting depth for block calls (B stack) too high"
-    elif Value == 0x3576: return "Local data allocation error"
-    elif Value == 0x3578: return "Unknown instruction"
-    elif Value == 0x357A: return "Jump instruction to target outside of the block"
-    elif Value == 0x3582: return "Memory error detected and corrected by operating system"
-    elif Value == 0x3583: return "Accumulation of detected and corrected memo errors"
-    elif Value == 0x3585: return "Error in the PC operating system (only for LC RTX)"
-    elif Value == 0x3587: return "Multi-bit memory error detected and corrected"
-    elif Value == 0x35A1: return "User interface (OB or FRB) not found"
-    elif Value == 0x35A2: return "OB not loaded (started by SFC or operating system due to configuration)"
-    elif Value == 0x35A3: return "Error when operating system accesses a block"
-    elif Value == 0x35A4: return "PROFInet Interface DB cannot be addressed"
-    elif Value == 0x35D2: return "Diagnostic entries cannot be sent at present"
-    elif Value == 0x35D3: return "Synchronization frames cannot be sent"
-    elif Value == 0x35D4: return "Illegal time jump resulting from synchronization"
-    elif Value == 0x35D5: return "Error adopting the synchronization time"
-    elif Value == 0x35E1: return "Incorrect frame ID in GD"
-    elif Value == 0x35E2: return "GD packet status cannot be entered in DB"
-    elif Value == 0x35E3: return "Frame length error in GD"
-    elif Value == 0x35E4: return "Illegal GD packet number received"
-    elif Value == 0x35E5: return "Error accessing DB in communication SFBs for configured S7 connections"
-    elif Value == 0x35E6: return "GD total status cannot be entered in DB"
-    elif Value == 0x3821: return "BATTF: failure on at least one backup battery of the central rack, problem eliminated"
-    elif Value == 0x3822: return "BAF: failure of backup voltage on central rack, problem eliminated"
-    elif Value == 0x3823: return "24 volt supply failure on central rack, problem eliminated"
-    elif Value == 0x3825: return "BATTF: failure on at least one backup battery of the redundant central rack, problem eliminated"
-    elif Value == 0x3826: return "BAF: failure of backup voltage on redundant central rack, problem eliminated"
-    elif Value == 0x3827: return "24 volt supply failure on redundant central rack, problem eliminated"
-    elif Value == 0x3831: return "BATTF: failure of at least one backup battery of the expansion rack, problem eliminated"
-    elif Value == 0x3832: return "BAF: failure of backup voltage on expansion rack, problem eliminated"
-    elif Value == 0x3833: return "24 volt supply failure on at least one expansion rack, problem eliminated"
-    elif Value == 0x3842: return "Module OK"
-    elif Value == 0x3854: return "PROFINET IO interface submodule/submodule and matches the configured interface submodule/submodule"
-    elif Value == 0x3855: return "PROFINET IO interface submodule/submodule inserted, but does not match the configured interface submodule/submodule"
-    elif Value == 0x3856: return "PROFINET IO interface submodule/submodule inserted, but error in module parameter assignment"
-    elif Value == 0x3858: return "PROFINET IO interface submodule access error corrected"
-    elif Value == 0x3861: return "Module/interface module inserted, module type OK"
-    elif Value == 0x3863: return "Module/interface module plugged in, but wrong module type"
-    elif Value == 0x3864: return "Module/interface module plugged in, but causing problem (type ID unreadable)"
-    elif Value == 0x3865: return "Module plugged in, but error in module parameter assignment"
-    elif Value == 0x3866: return "Module can be addressed again, load voltage error removed"
-    elif Value == 0x3881: return "Interface error leaving state"
-    elif Value == 0x3884: return "Interface module plugged in"
-    elif Value == 0x38B3: return "I/O access error when updating the process image input table"
-    elif Value == 0x38B4: return "I/O access error when transferring the process image to the output modules"
-    elif Value == 0x38C1: return "Expansion rack operational again (1 to 21), leaving state"
-    elif Value == 0x38C2: return "Expansion rack operational again but mismatch between setpoint and actual configuration"
-    elif Value == 0x38C4: return "Distributed I/Os: station failure, leaving state"
-    elif Value == 0x38C5: return "Distributed I/Os: station fault, leaving state"
-    elif Value == 0x38C6: return "Expansion rack operational again, but error(s) in module parameter assignment"
-    elif Value == 0x38C7: return "DP: station operational again, but error(s) in module parameter assignment"
-    elif Value == 0x38C8: return "DP: station operational again, but mismatch between setpoint and actual configuration"
-    elif Value == 0x38CB: return "PROFINET IO station operational again"
-    elif Value == 0x38CC: return "PROFINET IO station error corrected"
-    elif Value == 0x3921: return "BATTF: failure on at least one backup battery of the central rack"
-    elif Value == 0x3922: return "BAF: failure of backup voltage on central rack"
-    elif Value == 0x3923: return "24 volt supply failure on central rack"
-    elif Value == 0x3925: return "BATTF: failure on at least one backup battery of the redundant central rack"
-    elif Value == 0x3926: return "BAF: failure of backup voltage on redundant central rack"
-    elif Value == 0x3927: return "24 volt supply failure on redundant central rack"
-    elif Value == 0x3931: return "BATTF: failure of at least one backup battery of the expansion rack"
-    elif Value == 0x3932: return "BAF: failure of backup voltage on expansion rack"
-    elif Value == 0x3933: return "24 volt supply failure on at least one expansion rack"
-    elif Value == 0x3942: return "Module error"
-    elif Value == 0x3951: return "PROFINET IO submodule removed"
-    elif Value == 0x3954: return "PROFINET IO interface submodule/submodule removed"
-    elif Value == 0x3961: return "Module/interface module removed, cannot be addressed"
-    elif Value == 0x3966: return "Module cannot be addressed, load voltage error"
-    elif Value == 0x3968: return "Module reconfiguration has ended with error"
-    elif Value == 0x3981: return "Interface error entering state"
-    elif Value == 0x3984: return "Interface module removed"
-    elif Value == 0x3986: return "Performance of an H-Sync link negatively affected"
-    elif Value == 0x39B1: return "I/O access error when updating the process image input table"
-    elif Value == 0x39B2: return "I/O access error when transferring the process image to the output modules"
-    elif Value == 0x39B3: return "I/O access error when updating the process image input table"
-    elif Value == 0x39B4: return "I/O access error when transferring the process image to the output modules"
-    elif Value == 0x39C1: return "Expansion rack failure (1 to 21), entering state"
-    elif Value == 0x39C3: return "Distributed I/Os: master system failure entering state"
-    elif Value == 0x39C4: return "Distributed I/Os: station failure, entering state"
-    elif Value == 0x39C5: return "Distributed I/Os: station fault, entering state"
-    elif Value == 0x39CA: return "PROFINET IO system failure"
-    elif Value == 0x39CB: return "PROFINET IO station failure"
-    elif Value == 0x39CC: return "PROFINET IO station error"
-    elif Value == 0x39CD: return "PROFINET IO station operational again, but expected configuration does not match actual configuration"
-    elif Value == 0x39CE: return "PROFINET IO station operational again, but error(s) in module parameter assignment"
-    elif Value == 0x42F3: return "Checksum error detected and corrected by the operating system"
-    elif Value == 0x42F4: return "Standby CPU: connection/update via SFC90 is locked in the master CPU"
-    elif Value == 0x4300: return "Backed-up power on"
-    elif Value == 0x4301: return "Mode transition from STOP to STARTUP"
-    elif Value == 0x4302: return "Mode transition from STARTUP to RUN"
-    elif Value == 0x4303: return "STOP caused by stop switch being activated"
-    elif Value == 0x4304: return "STOP caused by PG STOP operation or by SFB 20 STOP"
-    elif Value == 0x4305: return "HOLD: breakpoint reached"
-    elif Value == 0x4306: return "HOLD: breakpoint exited"
-    elif Value == 0x4307: return "Memory reset started by PG operation"
-    elif Value == 0x4308: return "Memory reset started by switch setting"
-    elif Value == 0x4309: return "Memory reset started automatically (power on not backed up)"
-    elif Value == 0x430A: return "HOLD exited, transition to STOP"
-    elif Value == 0x430D: return "STOP caused by other CPU in multicomputing"
-    elif Value == 0x430E: return "Memory reset executed"
-    elif Value == 0x430F: return "STOP on the module due to STOP on a CPU"
-    elif Value == 0x4318: return "Start of CiR"
-    elif Value == 0x4319: return "CiR completed"
-    elif Value == 0x4357: return "Module watchdog started"
-    elif Value == 0x4358: return "All modules are ready for operation"
-    elif Value == 0x43B0: return "Firmware update was successful"
-    elif Value == 0x43B4: return "Error in firmware fuse"
-    elif Value == 0x43B6: return "Firmware updates canceled by redundant modules"
-    elif Value == 0x43D3: return "STOP on standby CPU"
-    elif Value == 0x43DC: return "Abort during link-up with switchover"
-    elif Value == 0x43DE: return "Updating aborted due to monitoring time being exceeded during the n-th attempt, new update attempt initiated"
-    elif Value == 0x43DF: return "Updating aborted for final time due to monitoring time being exceeded after completing the maximum amount of attempts. User intervention required"
-    elif Value == 0x43E0: return "Change from solo mode after link-up"
-    elif Value == 0x43E1: return "Change from link-up after updating"
-    elif Value == 0x43E2: return "Change from updating to redundant mode"
-    elif Value == 0x43E3: return "Master CPU: change from redundant mode to solo mode"
-    elif Value == 0x43E4: return "Standby CPU: change from redundant mode after error-search mode"
-    elif Value == 0x43E5: return "Standby CPU: change from error-search mode after link-up or STOP"
-    elif Value == 0x43E6: return "Link-up aborted on the standby CPU"
-    elif Value == 0x43E7: return "Updating aborted on the standby CPU"
-    elif Value == 0x43E8: return "Standby CPU: change from link-up after startup"
-    elif Value == 0x43E9: return "Standby CPU: change from startup after updating"
-    elif Value == 0x43F1: return "Reserve-master switchover"
-    elif Value == 0x43F2: return "Coupling of incompatible H-CPUs blocked by system program"
-    elif Value == 0x4510: return "STOP violation of the CPU's data range"
-    elif Value == 0x4520: return "DEFECTIVE: STOP not possible"
-    elif Value == 0x4521: return "DEFECTIVE: failure of instruction processing processor"
-    elif Value == 0x4522: return "DEFECTIVE: failure of clock chip"
-    elif Value == 0x4523: return "DEFECTIVE: failure of clock pulse generator"
-    elif Value == 0x4524: return "DEFECTIVE: failure of timer update function"
-    elif Value == 0x4525: return "DEFECTIVE: failure of multicomputing synchronization"
-    elif Value == 0x4527: return "DEFECTIVE: failure of I/O access monitoring"
-    elif Value == 0x4528: return "DEFECTIVE: failure of scan time monitoring"
-    elif Value == 0x4530: return "DEFECTIVE: memory test error in internal memory"
-    elif Value == 0x4532: return "DEFECTIVE: failure of core resources"
-    elif Value == 0x4536: return "DEFECTIVE: switch defective"
-    elif Value == 0x4540: return "STOP: Memory expansion of the internal work memory has gaps. First memory expansion too small or missing"
-    elif Value == 0x4541: return "STOP caused by priority class system"
-    elif Value == 0x4542: return "STOP caused by object management system"
-    elif Value == 0x4543: return "STOP caused by test functions"
-    elif Value == 0x4544: return "STOP caused by diagnostic system"
-    elif Value == 0x4545: return "STOP caused by communication system"
-    elif Value == 0x4546: return "STOP caused by CPU memory management"
-    elif Value == 0x4547: return "STOP caused by process image management"
-    elif Value == 0x4548: return "STOP caused by I/O management"
-    elif Value == 0x454A: return "STOP caused by configuration: an OB deselected with STEP 7 was being loaded into the CPU during STARTUP"
-    elif Value == 0x4550: return "DEFECTIVE: internal system error"
-    elif Value == 0x4555: return "No restart possible, monitoring time elapsed"
-    elif Value == 0x4556: return "STOP: memory reset request from communication system / due to data inconsistency"
-    elif Value == 0x4562: return "STOP caused by programming error (OB not loaded or not possible)"
-    elif Value == 0x4563: return "STOP caused by I/O access error (OB not loaded or not possible)"
-    elif Value == 0x4567: return "STOP caused by H event"
-    elif Value == 0x4568: return "STOP caused by time error (OB not loaded or not possible)"
-    elif Value == 0x456A: return "STOP caused by diagnostic interrupt (OB not loaded or not possible)"
-    elif Value == 0x456B: return "STOP caused by removing/inserting module (OB not loaded or not possible)"
-    elif Value == 0x456C: return "STOP caused by CPU hardware error (OB not loaded or not possible, or no FRB)"
-    elif Value == 0x456D: return "STOP caused by program sequence error (OB not loaded or not possible)"
-    elif Value == 0x456E: return "STOP caused by communication error (OB not loaded or not possible)"
-    elif Value == 0x456F: return "STOP caused by rack failure OB (OB not loaded or not possible)"
-    elif Value == 0x4570: return "STOP caused by process interrupt (OB not loaded or not possible)"
-    elif Value == 0x4571: return "STOP caused by nesting stack error"
-    elif Value == 0x4572: return "STOP caused by master control relay stack error"
-    elif Value == 0x4573: return "STOP caused by exceeding the nesting depth for synchronous errors"
-    elif Value == 0x4574: return "STOP caused by exceeding interrupt stack nesting depth in the priority class stack"
-    elif Value == 0x4575: return "STOP caused by exceeding block stack nesting depth in the priority class stack"
-    elif Value == 0x4576: return "STOP caused by error when allocating the local data"
-    elif Value == 0x4578: return "STOP caused by unknown opcode"
-    elif Value == 0x457A: return "STOP caused by code length error"
-    elif Value == 0x457B: return "STOP caused by DB not being loaded on on-board I/Os"
-    elif Value == 0x457D: return "Reset/clear request because the version of the internal interface to the integrated technology was changed"
-    elif Value == 0x457F: return "STOP caused by STOP command"
-    elif Value == 0x4580: return "STOP: back-up buffer contents inconsistent (no transition to RUN)"
-    elif Value == 0x4590: return "STOP caused by overloading the internal functions"
-    elif Value == 0x45D5: return "LINK-UP rejected due to mismatched CPU memory configuration of the sub-PLC"
-    elif Value == 0x45D6: return "LINK-UP rejected due to mismatched system program of the sub-PLC"
-    elif Value == 0x45D8: return "DEFECTIVE: hardware fault detected due to other error"
-    elif Value == 0x45D9: return "STOP due to SYNC module error"
-    elif Value == 0x45DA: return "STOP due to synchronization error between H CPUs"
-    elif Value == 0x45DD: return "LINK-UP rejected due to running test or other online functions"
-    elif Value == 0x4926: return "DEFECTIVE: failure of the watchdog for I/O access"
-    elif Value == 0x4931: return "STOP or DEFECTIVE: memory test error in memory submodule"
-    elif Value == 0x4933: return "Checksum error"
-    elif Value == 0x4934: return "DEFECTIVE: memory not available"
-    elif Value == 0x4935: return "DEFECTIVE: cancelled by watchdog/processor exceptions"
-    elif Value == 0x4949: return "STOP caused by continuous hardware interrupt"
-    elif Value == 0x494D: return "STOP caused by I/O error"
-    elif Value == 0x494E: return "STOP caused by power failure"
-    elif Value == 0x494F: return "STOP caused by configuration error"
-    elif Value == 0x4959: return "One or more modules not ready for operation"
-    elif Value == 0x497C: return "STOP caused by integrated technology"
-    elif Value == 0x49A0: return "STOP caused by parameter assignment error or non-permissible variation of setpoint and actual extension: Start-up blocked"
-    elif Value == 0x49A1: return "STOP caused by parameter assignment error: memory reset request"
-    elif Value == 0x49A2: return "STOP caused by error in parameter modification: startup disabled"
-    elif Value == 0x49A3: return "STOP caused by error in parameter modification: memory reset request"
-    elif Value == 0x49A4: return "STOP: inconsistency in configuration data"
-    elif Value == 0x49A5: return "STOP: distributed I/Os: inconsistency in the loaded configuration information"
-    elif Value == 0x49A6: return "STOP: distributed I/Os: invalid configuration information"
-    elif Value == 0x49A7: return "STOP: distributed I/Os: no configuration information"
-    elif Value == 0x49A8: return "STOP: error indicated by the interface module for the distributed I/Os"
-    elif Value == 0x49B1: return "Firmware update data incorrect"
-    elif Value == 0x49B2: return "Firmware update: hardware version does not match firmware"
-    elif Value == 0x49B3: return "Firmware update: module type does not match firmware"
-    elif Value == 0x49D0: return "LINK-UP aborted due to violation of coordination rules"
-    elif Value == 0x49D1: return "LINK-UP/UPDATE sequence aborted"
-    elif Value == 0x49D2: return "Standby CPU changed to STOP due to STOP on the master CPU during link-up"
-    elif Value == 0x49D4: return "STOP on a master, since partner CPU is also a master (link-up error)"
-    elif Value == 0x49D7: return "LINK-UP rejected due to change in user program or in configuration"
-    elif Value == 0x510F: return "A problem as occurred with WinLC. This problem has caused the CPU to go into STOP mode or has caused a fault in the CPU"
-    elif Value == 0x530D: return "New startup information in the STOP mode"
-    elif Value == 0x5311: return "Startup despite Not Ready message from module(s)"
-    elif Value == 0x5371: return "Distributed I/Os: end of the synchronization with a DP master"
-    elif Value == 0x5380: return "Diagnostic buffer entries of interrupt and asynchronous errors disabled"
-    elif Value == 0x5395: return "Distributed I/Os: reset of a DP master"
-    elif Value == 0x53A2: return "Download of technology firmware successful"
-    elif Value == 0x53A4: return "Download of technology DB not successful"
-    elif Value == 0x53FF: return "Reset to factory setting"
-    elif Value == 0x5445: return "Start of System reconfiguration in RUN mode"
-    elif Value == 0x5481: return "All licenses for runtime software are complete again"
-    elif Value == 0x5498: return "No more inconsistency with DP master systems due to CiR"
-    elif Value == 0x5545: return "Start of System reconfiguration in RUN mode"
-    elif Value == 0x5581: return "One or several licenses for runtime software are missing"
-    elif Value == 0x558A: return "Difference between the MLFB of the configured and inserted CPU"
-    elif Value == 0x558B: return "Difference in the firmware version of the configured and inserted CPU"
-    elif Value == 0x5598: return "Start of possible inconsistency with DP master systems due to CiR"
-    elif Value == 0x55A5: return "Version conflict: internal interface with integrated technology"
-    elif Value == 0x55A6: return "The maximum number of technology objects has been exceeded"
-    elif Value == 0x55A7: return "A technology DB of this type is already present"
-    elif Value == 0x5879: return "Diagnostic message from DP interface: EXTF LED off"
-    elif Value == 0x5960: return "Parameter assignment error when switching"
-    elif Value == 0x5961: return "Parameter assignment error"
-    elif Value == 0x5962: return "Parameter assignment error preventing startup"
-    elif Value == 0x5963: return "Parameter assignment error with memory reset request"
-    elif Value == 0x5966: return "Parameter assignment error when switching"
-    elif Value == 0x5969: return "Parameter assignment error with startup blocked"
-    elif Value == 0x596A: return "PROFINET IO: IP address of an IO device already present"
-    elif Value == 0x596B: return "IP address of an Ethernet interface already exists"
-    elif Value == 0x596C: return "Name of an Ethernet interface already exists"
-    elif Value == 0x596D: return "The existing network configuration does not mach the system requirements or configuration"
-    elif Value == 0x5979: return "Diagnostic message from DP interface: EXTF LED on"
-    elif Value == 0x597C: return "DP Global Control command failed or moved"
-    elif Value == 0x59A0: return "The interrupt can not be associated in the CPU"
-    elif Value == 0x59A1: return "Configuration error in the integrated technology"
-    elif Value == 0x59A3: return "Error when downloading the integrated technology"
-    elif Value == 0x6253: return "Firmware update: End of firmware download over the network"
-    elif Value == 0x6316: return "Interface error when starting programmable controller"
-    elif Value == 0x6353: return "Firmware update: Start of firmware download over the network"
-    elif Value == 0x6390: return "Formatting of Micro Memory Card complete"
-    elif Value == 0x6500: return "Connection ID exists twice on module"
-    elif Value == 0x6501: return "Connection resources inadequate"
-    elif Value == 0x6502: return "Error in the connection description"
-    elif Value == 0x6510: return "CFB structure error detected in instance DB when evaluating EPROM"
-    elif Value == 0x6514: return "GD packet number exists twice on the module"
-    elif Value == 0x6515: return "Inconsistent length specifications in GD configuration information"
-    elif Value == 0x6521: return "No memory submodule and no internal memory available"
-    elif Value == 0x6522: return "Illegal memory submodule: replace submodule and reset memory"
-    elif Value == 0x6523: return "Memory reset request due to error accessing submodule"
-    elif Value == 0x6524: return "Memory reset request due to error in block header"
-    elif Value == 0x6526: return "Memory reset request due to memory replacement"
-    elif Value == 0x6527: return "Memory replaced, therefore restart not possible"
-    elif Value == 0x6528: return "Object handling function in the STOP/HOLD mode, no restart possible"
-    elif Value == 0x6529: return "No startup possible during the \"load user program\" function"
-    elif Value == 0x652A: return "No startup because block exists twice in user memory"
-    elif Value == 0x652B: return "No startup because block is too long for submodule - replace submodule"
-    elif Value == 0x652C: return "No startup due to illegal OB on submodule"
-    elif Value == 0x6532: return "No startup because illegal configuration information on submodule"
-    elif Value == 0x6533: return "Memory reset request because of invalid submodule content"
-    elif Value == 0x6534: return "No startup: block exists more than once on submodule"
-    elif Value == 0x6535: return "No startup: not enough memory to transfer block from submodule"
-    elif Value == 0x6536: return "No startup: submodule contains an illegal block number"
-    elif Value == 0x6537: return "No startup: submodule contains a block with an illegal length"
-    elif Value == 0x6538: return "Local data or write-protection ID (for DB) of a block illegal for CPU"
-    elif Value == 0x6539: return "Illegal command in block (detected by compiler)"
-    elif Value == 0x653A: return "Memory reset request because local OB data on submodule too short"
-    elif Value == 0x6543: return "No startup: illegal block type"
-    elif Value == 0x6544: return "No startup: attribute \"relevant for processing\" illegal"
-    elif Value == 0x6545: return "Source language illegal"
-    elif Value == 0x6546: return "Maximum amount of configuration information reached"
-    elif Value == 0x6547: return "Parameter assignment error assigning parameters to modules (not on P bus, cancel download)"
-    elif Value == 0x6548: return "Plausibility error during block check"
-    elif Value == 0x6549: return "Structure error in block"
-    elif Value == 0x6550: return "A block has an error in the CRC"
-    elif Value == 0x6551: return "A block has no CRC"
-    elif Value == 0x6560: return "SCAN overflow"
-    elif Value == 0x6805: return "Resource problem on configured connections, eliminated"
-    elif Value == 0x6881: return "Interface error leaving state"
-    elif Value == 0x6905: return "Resource problem on configured connections"
-    elif Value == 0x6981: return "Interface error entering state"
-    elif Value == 0x72A2: return "Failure of a DP master or a DP master system"
-    elif Value == 0x72A3: return "Redundancy restored on the DP slave"
-    elif Value == 0x72DB: return "Safety program: safety mode disabled"
-    elif Value == 0x72E0: return "Loss of redundancy in communication, problem eliminated"
-    elif Value == 0x7301: return "Loss of redundancy (1 of 2) due to failure of a CPU"
-    elif Value == 0x7302: return "Loss of redundancy (1 of 2) due to STOP on the standby triggered by user"
-    elif Value == 0x7303: return "H system (1 of 2) changed to redundant mode"
-    elif Value == 0x7323: return "Discrepancy found in operating system data"
-    elif Value == 0x7331: return "Standby-master switchover due to master failure"
-    elif Value == 0x7333: return "Standby-master switchover due to system modification during runtime"
-    elif Value == 0x7334: return "Standby-master switchover due to communication error at the synchronization module"
-    elif Value == 0x7340: return "Synchronization error in user program due to elapsed wait time"
-    elif Value == 0x7341: return "Synchronization error in user program due to waiting at different synchronization points"
-    elif Value == 0x7342: return "Synchronization error in operating system due to waiting at different synchronization points"
-    elif Value == 0x7343: return "Synchronization error in operating system due to elapsed wait time"
-    elif Value == 0x7344: return "Synchronization error in operating system due to incorrect data"
-    elif Value == 0x734A: return "The \"Re-enable\" job triggered by SFC 90 \"H_CTRL\" was executed"
-    elif Value == 0x73A3: return "Loss of redundancy on the DP slave"
-    elif Value == 0x73C1: return "Update process canceled"
-    elif Value == 0x73C2: return "Updating aborted due to monitoring time being exceeded during the n-th attempt (1 = n = max. possible number of update attempts after abort due to excessive monitoring time)"
-    elif Value == 0x73D8: return "Safety mode disabled"
-    elif Value == 0x73DB: return "Safety program: safety mode enabled"
-    elif Value == 0x73E0: return "Loss of redundancy in communication"
-    elif Value == 0x74DD: return "Safety program: Shutdown of a fail-save runtime group disabled"
-    elif Value == 0x74DE: return "Safety program: Shutdown of the F program disabled"
-    elif Value == 0x74DF: return "Start of F program initialization"
-    elif Value == 0x7520: return "Error in RAM comparison"
-    elif Value == 0x7521: return "Error in comparison of process image output value"
-    elif Value == 0x7522: return "Error in comparison of memory bits, timers, or counters"
-    elif Value == 0x75D1: return "Safety program: Internal CPU error"
-    elif Value == 0x75D2: return "Safety program error: Cycle time time-out"
-    elif Value == 0x75D6: return "Data corrupted in safety program prior to the output to F I/O"
-    elif Value == 0x75D7: return "Data corrupted in safety program prior to the output to partner F-CPU"
-    elif Value == 0x75D9: return "Invalid REAL number in a DB"
-    elif Value == 0x75DA: return "Safety program: Error in safety data format"
-    elif Value == 0x75DC: return "Runtime group, internal protocol error"
-    elif Value == 0x75DD: return "Safety program: Shutdown of a fail-save runtime group enabled"
-    elif Value == 0x75DE: return "Safety program: Shutdown of the F program enabled"
-    elif Value == 0x75DF: return "End of F program initialization"
-    elif Value == 0x75E1: return "Safety program: Error in FB \"F_PLK\" or \"F_PLK_O\" or \"F_CYC_CO\" or \"F_TEST\" or \"F_TESTC\""
-    elif Value == 0x75E2: return "Safety program: Area length error"
-    elif Value == 0x7852: return "SYNC module inserted"
-    elif Value == 0x7855: return "SYNC module eliminated"
-    elif Value == 0x78D3: return "Communication error between PROFIsafe and F I/O"
-    elif Value == 0x78D4: return "Error in safety relevant communication between F CPUs"
-    elif Value == 0x78D5: return "Error in safety relevant communication between F CPUs"
-    elif Value == 0x78E3: return "F-I/O device input channel depassivated"
-    elif Value == 0x78E4: return "F-I/O device output channel depassivated"
-    elif Value == 0x78E5: return "F-I/O device depassivated"
-    elif Value == 0x7934: return "Standby-master switchover due to connection problem at the SYNC module"
-    elif Value == 0x7950: return "Synchronization module missing"
-    elif Value == 0x7951: return "Change at the SYNC module without Power On"
-    elif Value == 0x7952: return "SYNC module removed"
-    elif Value == 0x7953: return "Change at the SYNC-module without reset"
-    elif Value == 0x7954: return "SYNC module: rack number assigned twice"
-    elif Value == 0x7955: return "SYNC module error"
-    elif Value == 0x7956: return "Illegal rack number set on SYNC module"
-    elif Value == 0x7960: return "Redundant I/O: Time-out of discrepancy time at digital input, error is not yet localized"
-    elif Value == 0x7961: return "Redundant I/O, digital input error: Signal change after expiration of the discrepancy time"
-    elif Value == 0x7962: return "Redundant I/O: Digital input error"
-    elif Value == 0x796F: return "Redundant I/O: The I/O was globally disabled"
-    elif Value == 0x7970: return "Redundant I/O: Digital output error"
-    elif Value == 0x7980: return "Redundant I/O: Time-out of discrepancy time at analog input"
-    elif Value == 0x7981: return "Redundant I/O: Analog input error"
-    elif Value == 0x7990: return "Redundant I/O: Analog output error"
-    elif Value == 0x79D3: return "Communication error between PROFIsafe and F I/O"
-    elif Value == 0x79D4: return "Error in safety relevant communication between F CPUs"
-    elif Value == 0x79D5: return "Error in safety relevant communication between F CPUs"
-    elif Value == 0x79E3: return "F-I/O device input channel passivated"
-    elif Value == 0x79E4: return "F-I/O device output channel passivated"
-    elif Value == 0x79E5: return "F-I/O device passivated"
-    elif Value == 0x79E6: return "Inconsistent safety program"
-    elif Value == 0x79E7: return "Simulation block (F system block) loaded"
-    else: return "Undefined"
+    return _CPU_DIAGNOSTICS.get(Value, "Undefined")
+
+
+# LED ID -> name
+_CPU_LEDS = {
+    0x0001: "SF (group error)",
+    0x0002: "INTF (internal error)",
+    0x0003: "EXTF (external error)",
+    0x0004: "RUN",
+    0x0005: "STOP",
+    0x0006: "FRCE (force)",
+    0x0007: "CRST (cold restart)",
+    0x0008: "BAF (battery fault/overload, short circuit of battery voltage on bus)",
+    0x0009: "USR (user-defined)",
+    0x000a: "USR1 (user-defined)",
+    0x000b: "BUS1F (bus error interface 1)",
+    0x000c: "BUS2F (bus error interface 2)",
+    0x000d: "REDF (redundancy error)",
+    0x000e: "MSTR (master)",
+    0x000f: "RACK0 (rack number 0)",
+    0x0010: "RACK1 (rack number 1)",
+    0x0011: "RACK2 (rack number 2)",
+    0x0012: "IFM1F (interface error interface module 1)",
+    0x0013: "IFM2F (interface error interface module 2)",
+    0x0014: "BUS3F (bus error interface 3)",
+    0x0015: "MAINT (maintenance demand)",
+    0x0016: "DC24V",
+    0x0080: "IF (init failure)",
+    0x0081: "UF (user failure)",
+    0x0082: "MF (monitoring failure)",
+    0x0083: "CF (communication failure)",
+    0x0084: "TF (task failure)",
+    0x00ec: "APPL_STATE_RED",
+    0x00ed: "APPL_STATE_GREEN",
+}
 
 
 def get_cpu_led(Value:int) -> str:
-    if Value == 0x0001: return "SF (group error)"
-    elif Value == 0x0002: return "INTF (internal error)"
-    elif Value == 0x0003: return "EXTF (external error)"
-    elif Value == 0x0004: return "RUN"
-    elif Value == 0x0005: return "STOP"
-    elif Value == 0x0006: return "FRCE (force)"
-    elif Value == 0x0007: return "CRST (cold restart)"
-    elif Value == 0x0008: return "BAF (battery fault/overload, short circuit of battery voltage on bus)"
-    elif Value == 0x0009: return "USR (user-defined)"
-    elif Value == 0x000a: return "USR1 (user-defined)"
-    elif Value == 0x000b: return "BUS1F (bus error interface 1)"
-    elif Value == 0x000c: return "BUS2F (bus error interface 2)"
-    elif Value == 0x000d: return "REDF (redundancy error)"
-    elif Value == 0x000e: return "MSTR (master)"
-    elif Value == 0x000f: return "RACK0 (rack number 0)"
-    elif Value == 0x0010: return "RACK1 (rack number 1)"
-    elif Value == 0x0011: return "RACK2 (rack number 2)"
-    elif Value == 0x0012: return "IFM1F (interface error interface module 1)"
-    elif Value == 0x0013: return "IFM2F (interface error interface module 2)"
-    elif Value == 0x0014: return "BUS3F (bus error interface 3)"
-    elif Value == 0x0015: return "MAINT (maintenance demand)"
-    elif Value == 0x0016: return "DC24V"
-    elif Value == 0x0080: return "IF (init failure)"
-    elif Value == 0x0081: return "UF (user failure)"
-    elif Value == 0x0082: return "MF (monitoring failure)"
-    elif Value == 0x0083: return "CF (communication failure)"
-    elif Value == 0x0084: return "TF (task failure)"
-    elif Value == 0x00ec: return "APPL_STATE_RED"
-    elif Value == 0x00ed: return "APPL_STATE_GREEN"
-    else: return "Undefined"
+    return _CPU_LEDS.get(Value, "Undefined")
+
+
+# DataType -> (unpack format, convert(value, endian) or None)
+_DECODE_FORMATS = {
+    DataType.BIT:           ('B', lambda value, endian: value == 1),
+    DataType.BYTE:          ('B', None),
+    DataType.CHAR:          ('1sB', None),
+    DataType.INT:           ('h', None),
+    DataType.WORD:          ('H', None),
+    DataType.DATE:          ('H', lambda value, endian: get_date(DaysSince=value)), # days since 1990-01-01
+    DataType.COUNTER:       ('h', lambda value, endian: get_counter(Value=value)),
+    DataType.TIMER:         ('h', lambda value, endian: get_timer(buffer=value)),
+    DataType.DATETIME:      ('8s', lambda value, endian: get_datetime(buffer=value)),
+    DataType.S5TIME:        ('2s', lambda value, endian: get_s5_time(buffer=value)),
+    DataType.DINT:          ('i', None),
+    DataType.REAL:          ('f', None),
+    DataType.DWORD:         ('I', None),
+    DataType.TIME:          ('I', None),
+    DataType.TIME_OF_DAY:   ('I', None),
+    DataType.IECCOUNTER:    ('9s', lambda value, endian: get_iec_counter(buffer=value, endian=endian)),
+    DataType.IECTIMER:      ('22s', lambda value, endian: get_iec_timer(buffer=value, endian=endian)),
+}
+
+# DataType -> array typecode, for plain numbers whose array item matches the wire size
+_ARRAY_TYPECODES = {
+    item_type: unpackFormat
+    for item_type, (unpackFormat, convert) in _DECODE_FORMATS.items()
+    if convert is None
+        and unpackFormat in array.typecodes
+        and array.array(unpackFormat).itemsize == struct.calcsize(f'>{unpackFormat}')
+}
+
+# endian -> array items need a byteswap
+_ARRAY_BYTESWAP = {
+    '=': False,
+    '<': sys.byteorder == 'big',
+    '>': sys.byteorder == 'little',
+    '!': sys.byteorder == 'little',
+}
+
+# DataType -> (pack format, convert(value) -> pack arguments)
+_ENCODE_FORMATS = {
+    DataType.BIT:           ('BB', lambda value: (abs(int(value)&0xFF), 0x00)),
+    DataType.BYTE:          ('BB', lambda value: (abs(int(value)&0xFF), 0x00)),
+    DataType.CHAR:          ('1sB', lambda value: (str(value).encode(), 0)),
+    DataType.INT:           ('h', lambda value: (int(value),)),
+    DataType.WORD:          ('H', lambda value: (abs(value),)),
+    DataType.DINT:          ('i', lambda value: (int(value),)),
+    DataType.DWORD:         ('I', lambda value: (abs(int(value)),)),
+    DataType.TIME_OF_DAY:   ('I', lambda value: (abs(int(value)),)),
+    DataType.TIME:          ('I', lambda value: (abs(int(value)),)),
+    DataType.REAL:          ('f', lambda value: (value,)),
+    DataType.DATE:          ('H', lambda value: (set_date(value),)), # days since 1990-01-01
+    DataType.DATETIME:      ('8s', lambda value: (set_datetime(value),)),
+    DataType.COUNTER:       ('H', lambda value: (set_counter(Value=abs(int(value))),)),
+    DataType.TIMER:         ('H', lambda value: (int(value),)),
+    DataType.S5TIME:        ('2s', lambda value: (set_s5_time(value),)),
+    DataType.IECCOUNTER:    ('10s', lambda value: (set_iec_counter(value),)),
+    DataType.IECTIMER:      ('22s', lambda value: (set_iec_timer(value),)),
+}
+
+# (endian, DataType) -> compiled codec, filled on first use
+_DECODERS = {}
+_ENCODERS = {}